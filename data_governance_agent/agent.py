@@ -1,19 +1,15 @@
-from google.adk.agents.llm_agent import Agent
-
-# Import your existing coordinator that runs the whole pipeline
-from src.agents.coordinator_agent import CoordinatorAgent
-from google.adk.agents import LlmAgent, SequentialAgent
-
-from src.agents.coordinator_agent import CoordinatorAgent
-from src.agents.schema_agent import SchemaValidationAgent
-from src.agents.dq_agent import DataQualityAgent
-from src.agents.pii_policy_agent import PiiPolicyAgent
-from src.pipeline.run_pipeline import load_config, load_schema, load_events_raw
-from src.pipeline.report_markdown import (build_markdown_from_summary, save_markdown_report)
-from src.agents.run_summary_agent import generate_markdown_report
-from src.pipeline.auto_runner import auto_run_once
+import asyncio
+import functools
+import operator
+import os
+import weakref
+from typing import Literal
 
+from google.adk.agents import LlmAgent, ParallelAgent, SequentialAgent
 
+# The pipeline modules (and pandas/numpy behind them) are imported inside the
+# tool functions so that importing this module -- ADK server start-up and
+# reloads -- doesn't pay for them until a tool actually runs.
 
 
 GEMINI_MODEL = "gemini-2.0-flash-lite"
@@ -106,227 +102,507 @@ DO NOT invent data not present in the input.
 Your tone should be professional, precise, and focused on operational remediation.
 """
 
+_RUN_SUMMARY_FIRST_LINE = RUN_SUMMARY_INSTRUCTION.split("\n", 1)[0]
+
 print(
     "[DEBUG] Loaded ReportAgent prompt first line:",
-    RUN_SUMMARY_INSTRUCTION.splitlines()[0],
+    _RUN_SUMMARY_FIRST_LINE,
     "FROM:",
     __file__,
 )
 
 
-def run_full_governance_pipeline() -> dict:
-    coordinator = CoordinatorAgent()
-    result = coordinator.run()
-    summary = result["summary"]
-    checks = summary["checks"]
-    return {
-        "mode": "full",
-        "status": "success",
-        "overall_passed": summary["overall_passed"],
-        "schema_passed": checks["schema"]["passed"],
-        "dq_passed": checks["data_quality"]["passed"],
-        "pii_passed": checks["pii_policy"]["passed"],
-        "rows_in": summary["lineage"]["source"]["rows_in"],
-        "rows_out": summary["lineage"]["target"]["rows_out"],
-        "source_filename": summary["lineage"]["source"]["filename"],
-        "target_filename": summary["lineage"]["target"]["filename"],
-    }
+# Upper bound on how many check runs are in flight at once, shared by the
+# full pipeline run and the *_only tools (the ParallelChecks specialists
+# can all call their tool at the same moment). Override with
+# GOV_MAX_PARALLEL_TOOLS.
+MAX_PARALLEL_TOOLS = int(os.environ.get("GOV_MAX_PARALLEL_TOOLS", "3"))
 
+# event loop -> its tool semaphore. Created lazily per running loop: on
+# Python 3.10 an asyncio primitive binds to the first loop that uses it, so
+# a single module-level one fails for callers that start a fresh loop per
+# call ("bound to a different event loop").
+_TOOL_SEMS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
 
-def run_schema_checks_only() -> dict:
-    config = load_config()
-    schema = load_schema("events_schema.json")
-    events_filename = config["sources"]["events"]["filename"]
-    df = load_events_raw(events_filename)
 
-    agent = SchemaValidationAgent()
-    results = agent.run(df=df, schema=schema)
+def _tool_sem() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _TOOL_SEMS.get(loop)
+    if sem is None:
+        sem = _TOOL_SEMS[loop] = asyncio.Semaphore(MAX_PARALLEL_TOOLS)
+    return sem
 
-    return {
-        "mode": "schema_only",
-        "status": "success",
-        "schema_passed": results["passed"],
-        "missing_columns": results["missing_columns"],
-        "extra_columns": results["extra_columns"],
-        "invalid_values": results["invalid_values"],
-        "source_filename": events_filename,
-    }
 
+async def _run_bounded(fn, /, *args, **kwargs):
+    """Run a blocking check in a worker thread, holding a tool semaphore slot."""
+    async with _tool_sem():
+        return await asyncio.to_thread(fn, *args, **kwargs)
 
-def run_data_quality_checks_only() -> dict:
-    config = load_config()
-    events_filename = config["sources"]["events"]["filename"]
-    df = load_events_raw(events_filename)
 
-    dq_config = config.get("data_quality", {})
-    agent = DataQualityAgent()
-    results = agent.run(df=df, dq_config=dq_config)
+@functools.lru_cache(maxsize=1)
+def _events_schema_for(mtime_ns: int) -> dict:
+    from src.pipeline.run_pipeline import SCHEMA_FILES, load_schema
 
-    return {
-        "mode": "dq_only",
-        "status": "success",
-        "dq_passed": results["passed"],
-        "null_fractions": results["null_fractions"],
-        "columns_exceeding_null_threshold": results["columns_exceeding_null_threshold"],
-        "non_null_violations": results["non_null_violations"],
-        "unique_key_violations": results["unique_key_violations"],
-        "invalid_event_types": results["invalid_event_types"],
-        "source_filename": events_filename,
-    }
+    return load_schema(SCHEMA_FILES["events"])
 
 
-def run_pii_policy_checks_only() -> dict:
-    config = load_config()
-    schema = load_schema("events_schema.json")
-    events_filename = config["sources"]["events"]["filename"]
-    df = load_events_raw(events_filename)
+def _events_schema() -> dict:
+    """
+    The events schema, shared between calls and re-read only when the file
+    changes (its mtime is the cache key, as in run_pipeline._parse_file).
+    """
+    from src.pipeline.run_pipeline import SCHEMA_DIR, SCHEMA_FILES
+
+    return _events_schema_for((SCHEMA_DIR / SCHEMA_FILES["events"]).stat().st_mtime_ns)
 
-    policy_config = config.get("policy", {})
-    agent = PiiPolicyAgent()
-    results = agent.run(df=df, schema=schema, policy_config=policy_config)
 
+# Output key -> path into the run summary, for the "full" tool result.
+_FULL_KEYS = (
+    ("overall_passed", ("overall_passed",)),
+    ("schema_passed", ("checks", "schema", "passed")),
+    ("dq_passed", ("checks", "data_quality", "passed")),
+    ("pii_passed", ("checks", "pii_policy", "passed")),
+    ("rows_in", ("lineage", "source", "rows_in")),
+    ("rows_out", ("lineage", "target", "rows_out")),
+    ("source_filename", ("lineage", "source", "filename")),
+    ("target_filename", ("lineage", "target", "filename")),
+)
+
+
+def _flatten(summary: dict, spec: tuple) -> dict:
     return {
-        "mode": "pii_only",
-        "status": "success",
-        "pii_passed": results["passed"],
-        "detected_pii_columns": results["detected_pii_columns"],
-        "removed_pii_columns": results["removed_pii_columns"],
-        "remaining_pii_in_curated": results["remaining_pii_in_curated"],
-        "source_filename": events_filename,
+        key: functools.reduce(operator.getitem, path, summary) for key, path in spec
     }
 
 
-schema_llm_agent = LlmAgent(
-    name="SchemaAgent",
-    model=GEMINI_MODEL,
-    description=(
-        "Specialist agent that validates event data schema: required columns, "
-        "extra columns, and allowed values."
-    ),
-    instruction=(
-        "You are a schema governance specialist for an event analytics pipeline.\n"
-        "Call the 'run_schema_checks_only' tool exactly once to inspect the data. "
-        "Then:\n"
-        "1) Summarize whether the schema passed or failed.\n"
-        "2) List any missing or extra columns and invalid values.\n"
-        "3) Suggest specific schema changes or data fixes.\n"
-        "Write a concise JSON-style summary and explanation; "
-        "this will be used by downstream agents."
-    ),
-    tools=[run_schema_checks_only],
-    # ADK will store the final LLM response in session.state['schema_summary']
-    output_key="schema_summary",
-)
+def _full_result(summary: dict) -> dict:
+    return {"mode": "full", "status": "success", **_flatten(summary, _FULL_KEYS)}
 
-dq_llm_agent = LlmAgent(
-    name="DataQualityAgent",
-    model=GEMINI_MODEL,
-    description=(
-        "Specialist agent that analyzes data quality issues such as nulls, "
-        "non-null constraints, uniqueness, and invalid categories."
-    ),
-    instruction=(
-        "You are a data quality specialist for event analytics data.\n"
-        "Use the 'run_data_quality_checks_only' tool exactly once. Then:\n"
-        "1) Explain whether data quality checks passed or failed.\n"
-        "2) Highlight which columns violated thresholds (nulls, uniqueness, etc.).\n"
-        "3) Recommend concrete remediation steps (e.g., drop rows, backfill values, "
-        "tighten constraints).\n"
-        "Assume that another agent may have already run schema checks; "
-        "if 'schema_summary' is present in state, you may reference it in your reasoning.\n"
-        "Produce a compact summary that downstream agents can read."
-    ),
-    tools=[run_data_quality_checks_only],
-    output_key="dq_summary",
-)
 
-pii_llm_agent = LlmAgent(
-    name="PiiAgent",
-    model=GEMINI_MODEL,
-    description=(
-        "Specialist agent that focuses on PII detection and enforcement rules "
-        "for the analytics pipeline."
-    ),
-    instruction=(
-        "You are a privacy/PII governance expert.\n"
-        "Call the 'run_pii_policy_checks_only' tool once. Then:\n"
-        "1) Explain which columns are considered PII.\n"
-        "2) Describe what the pipeline did with each PII field "
-        "(kept in raw, removed in curated, etc.).\n"
-        "3) Flag any remaining PII in curated outputs and suggest how to fix it.\n"
-        "Use any prior 'schema_summary' or 'dq_summary' in state if available "
-        "for additional context.\n"
-        "Return a structured summary suitable for a final report."
-    ),
-    tools=[run_pii_policy_checks_only],
-    output_key="pii_summary",
-)
+async def _run_all(config: dict) -> dict:
+    """
+    Run the full pipeline through the shared CoordinatorAgent in a worker
+    thread (holding a tool semaphore slot). The coordinator runs the schema, DQ,
+    PII and FK checks side by side as runtime.parallel_agents says, and
+    writes the curated events.
+    """
+    from src.agents.run_summary_agent import remember_run_summary, run_and_summarize
 
-report_llm_agent = LlmAgent(
-    name="ReportAgent",
-    model=GEMINI_MODEL,
-    description=(
-        "Reporting agent that reads schema, data quality, and PII summaries "
-        "from shared state and produces an overall governance report."
-    ),
-    instruction=RUN_SUMMARY_INSTRUCTION,
-    tools=[],  # no direct tools; relies on shared state
-    output_key="governance_report",
-)
+    try:
+        summary = await _run_bounded(run_and_summarize, config)
+    except Exception as e:
+        return {
+            "mode": "full",
+            "status": "error",
+            "error": "pipeline_run_failed",
+            "detail": str(e),
+        }
 
-governance_workflow = SequentialAgent(
-    name="GovernanceWorkflow",
-    description=(
-        "Runs the full multi-step governance workflow in order: "
-        "schema validation → data quality validation → PII policy checks → final reporting. "
-        "Each sub-agent writes its results to session.state."
-    ),
-    sub_agents=[
-        schema_llm_agent,
-        dq_llm_agent,
-        pii_llm_agent,
-        report_llm_agent,
-    ],
-)
+    remember_run_summary(config, summary)
+    return _full_result(summary)
 
-root_agent = LlmAgent(
-    name="DataGovernanceRoot",
-    model=GEMINI_MODEL,
-    description=(
-        "Root coordinator agent for the data governance pipeline. "
-        "You decide whether to run the full multi-agent workflow or call "
-        "individual tools based on the user's request."
-    ),
-    instruction=(
-        "You coordinate a data governance workflow for an event analytics pipeline.\n"
-        "- If the user asks to 'run the full pipeline', 'run full governance', "
-        "'validate everything', or similar, delegate to the 'GovernanceWorkflow' "
-        "sequential agent.\n"
-        "- If the user only asks about schema, call the 'run_schema_checks_only' tool.\n"
-        "- If the user only asks about data quality, call the "
-        "'run_data_quality_checks_only' tool.\n"
-        "- If the user only asks about PII or privacy, call the "
-        "'run_pii_policy_checks_only' tool.\n"
-        "- If the user asks to 'generate a report', 'save a markdown report', "
-        "or similar, call the 'generate_markdown_report' tool.\n"
-        "- If the user asks to 'auto-run', 'check for new data and run', or "
-        "similar, call the 'auto_run_once' tool. This should be treated as an "
-        "idempotent, non-interactive run: if there is no new data, just report "
-        "that fact; if there is new data, run the pipeline and return where the "
-        "report was saved.\n"
-        "After calling a workflow or tool, explain the results clearly and suggest "
-        "concrete next steps. Do not try to add sub-agents yourself; use the "
-        "provided tools and the GovernanceWorkflow sub-agent."
-    ),
-    tools=[
-        run_full_governance_pipeline,
-        run_schema_checks_only,
-        run_data_quality_checks_only,
-        run_pii_policy_checks_only,
-        generate_markdown_report,   # ← now imported from run_summary_agent.py
-        auto_run_once,              # ← now imported from auto_runner.py
-    ],
-    sub_agents=[governance_workflow],
-)
 
+# The tools below are coroutines so ADK can await them without blocking its
+# event loop; the pandas work runs in worker threads via asyncio.to_thread.
+async def run_full_governance_pipeline() -> dict:
+    from src.agents.run_summary_agent import cached_run_summary
+    from src.pipeline.run_pipeline import load_config
 
+    config = await asyncio.to_thread(load_config)
+    # Reuse the last run (e.g. from generate_markdown_report) if nothing changed.
+    summary = cached_run_summary(config)
+    if summary is not None:
+        return _full_result(summary)
+    return await _run_all(config)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_events(events_filename: str, events_mtime_ns: int, events_size: int):
+    """
+    Load the raw events df once and share it between the *_only tools.
+    The file's mtime and size are part of the cache key so dropping in new
+    raw data (even within the same mtime tick) invalidates it.
+    The frame outlives a single call, so its dtypes are compacted once here.
+    """
+    from src.pipeline.run_pipeline import load_events_raw, optimize_dtypes
+
+    return optimize_dtypes(load_events_raw(events_filename))
+
+
+def _load_tool_inputs() -> tuple:
+    from src.pipeline.run_pipeline import RAW_DIR, load_config
+
+    # load_config() only re-parses the YAML when the file has changed.
+    config = load_config()
+    events_filename = config["sources"]["events"]["filename"]
+    st = (RAW_DIR / events_filename).stat()
+    df = _cached_events(events_filename, st.st_mtime_ns, st.st_size)
+    # Shallow copy: shares the column data but keeps column adds/drops by
+    # one tool from leaking into the cached frame.
+    return config, df.copy(deep=False)
+
+
+def _check_result(
+    mode: str, passed_key: str, results: dict, fields: tuple, config: dict
+) -> dict:
+    """Shape one agent's results into the dict returned by a *_only tool."""
+    out = {"mode": mode, "status": "success", passed_key: results["passed"]}
+    out.update({field: results[field] for field in fields})
+    out["source_filename"] = config["sources"]["events"]["filename"]
+    return out
+
+
+# tool name -> (inputs fingerprint, result) of its last successful call. A
+# repeat call on unchanged inputs -- common when the model calls the same
+# check twice in a conversation -- returns the recorded result instead of
+# re-running the check. One entry per tool, so the ledger stays tiny.
+_TOOL_LEDGER: dict = {}
+
+
+def _tool_inputs_key() -> tuple:
+    """
+    (mtime_ns, size) of the pipeline config, of every configured source file
+    (events, users, courses) and of every schema file the checks read.
+    """
+    from src.pipeline.run_pipeline import (
+        CONFIG_DIR,
+        RAW_DIR,
+        load_config,
+        schema_file_stats,
+    )
+
+    config_st = (CONFIG_DIR / "pipeline_config.yaml").stat()
+    sources = []
+    for name, src in sorted(load_config()["sources"].items()):
+        st = (RAW_DIR / src["filename"]).stat()
+        sources.append((name, src["filename"], st.st_mtime_ns, st.st_size))
+    return (
+        config_st.st_mtime_ns,
+        config_st.st_size,
+        tuple(sources),
+        schema_file_stats(),
+    )
+
+
+def _ledgered(tool):
+    """Record a *_only tool's successful result against its input files."""
+
+    @functools.wraps(tool)
+    async def wrapper() -> dict:
+        key = await asyncio.to_thread(_tool_inputs_key)
+        entry = _TOOL_LEDGER.get(tool.__name__)
+        if entry is not None and entry[0] == key:
+            return dict(entry[1])
+        result = await tool()
+        if result.get("status") == "success":
+            _TOOL_LEDGER[tool.__name__] = (key, result)
+        return dict(result)
+
+    return wrapper
+
+
+@_ledgered
+async def run_schema_checks_only() -> dict:
+    from src.agents.coordinator_agent import get_coordinator
+
+    config, df = await asyncio.to_thread(_load_tool_inputs)
+    results = await _run_bounded(
+        get_coordinator().schema_agent.run, df=df, schema=_events_schema()
+    )
+    return _check_result(
+        "schema_only",
+        "schema_passed",
+        results,
+        ("missing_columns", "extra_columns", "invalid_values"),
+        config,
+    )
+
+
+@_ledgered
+async def run_data_quality_checks_only() -> dict:
+    from src.agents.coordinator_agent import get_coordinator
+
+    config, df = await asyncio.to_thread(_load_tool_inputs)
+    results = await _run_bounded(
+        get_coordinator().dq_agent.run, df=df, dq_config=config.get("data_quality", {})
+    )
+    return _check_result(
+        "dq_only",
+        "dq_passed",
+        results,
+        (
+            "null_fractions",
+            "columns_exceeding_null_threshold",
+            "non_null_violations",
+            "unique_key_violations",
+            "invalid_event_types",
+            "null_event_types",
+        ),
+        config,
+    )
+
+
+@_ledgered
+async def run_pii_policy_checks_only() -> dict:
+    from src.agents.coordinator_agent import get_coordinator
+
+    config, df = await asyncio.to_thread(_load_tool_inputs)
+    results = await _run_bounded(
+        get_coordinator().pii_agent.run,
+        df=df,
+        schema=_events_schema(),
+        policy_config=config.get("policy", {}),
+    )
+    return _check_result(
+        "pii_only",
+        "pii_passed",
+        results,
+        ("detected_pii_columns", "removed_pii_columns", "remaining_pii_in_curated"),
+        config,
+    )
+
+
+def generate_markdown_report(config_override: dict | None = None) -> dict:
+    """
+    Run the full governance pipeline, save both JSON summary and markdown report,
+    and return basic info for the UI.
+    """
+    from src.agents.run_summary_agent import generate_markdown_report as _generate
+
+    return _generate(config_override=config_override)
+
+
+def auto_run_once() -> dict:
+    """
+    Check whether the raw events file changed since the last auto-run and, if
+    so, run the governance pipeline and save a markdown report. Safe to call
+    repeatedly: with no new data it is a cheap no-op.
+    """
+    from src.pipeline.auto_runner import auto_run_once as _auto_run_once
+
+    return _auto_run_once()
+
+
+GovernanceMode = Literal["full", "schema", "dq", "pii", "report", "auto"]
+
+_MODE_TOOLS = {
+    "full": run_full_governance_pipeline,
+    "schema": run_schema_checks_only,
+    "dq": run_data_quality_checks_only,
+    "pii": run_pii_policy_checks_only,
+    "report": generate_markdown_report,
+    "auto": auto_run_once,
+}
+
+
+async def run_governance(mode: GovernanceMode) -> dict:
+    """
+    Run one data governance action on the event analytics pipeline.
+
+    Args:
+        mode: "full" runs every check and writes the curated output;
+            "schema", "dq" and "pii" run only that check;
+            "report" runs the pipeline and saves a markdown report;
+            "auto" runs the pipeline and saves a report only if the raw
+            events file changed since the last auto-run.
+    """
+    tool = _MODE_TOOLS.get(mode)
+    if tool is None:
+        return {
+            "status": "error",
+            "error": "unknown_mode",
+            "detail": f"mode must be one of {sorted(_MODE_TOOLS)}, got {mode!r}",
+        }
+    if asyncio.iscoroutinefunction(tool):
+        return await tool()
+    return await asyncio.to_thread(tool)
+
+
+@functools.cache
+def _build_schema_llm_agent() -> LlmAgent:
+    return LlmAgent(
+        name="SchemaAgent",
+        model=GEMINI_MODEL,
+        description=(
+            "Specialist agent that validates event data schema: required columns, "
+            "extra columns, and allowed values."
+        ),
+        instruction=(
+            "You are a schema governance specialist for an event analytics pipeline.\n"
+            "Call the 'run_schema_checks_only' tool exactly once to inspect the data. "
+            "Then:\n"
+            "1) Summarize whether the schema passed or failed.\n"
+            "2) List any missing or extra columns and invalid values.\n"
+            "3) Suggest specific schema changes or data fixes.\n"
+            "Write a concise JSON-style summary and explanation; "
+            "this will be used by downstream agents."
+        ),
+        tools=[run_schema_checks_only],
+        # ADK will store the final LLM response in session.state['schema_summary']
+        output_key="schema_summary",
+    )
+
+
+@functools.cache
+def _build_dq_llm_agent() -> LlmAgent:
+    return LlmAgent(
+        name="DataQualityAgent",
+        model=GEMINI_MODEL,
+        description=(
+            "Specialist agent that analyzes data quality issues such as nulls, "
+            "non-null constraints, uniqueness, and invalid categories."
+        ),
+        instruction=(
+            "You are a data quality specialist for event analytics data.\n"
+            "Use the 'run_data_quality_checks_only' tool exactly once. Then:\n"
+            "1) Explain whether data quality checks passed or failed.\n"
+            "2) Highlight which columns violated thresholds (nulls, uniqueness, etc.).\n"
+            "3) Recommend concrete remediation steps (e.g., drop rows, backfill values, "
+            "tighten constraints).\n"
+            "Schema checks run concurrently in another agent, so don't wait for "
+            "or rely on 'schema_summary'; the report agent combines the findings.\n"
+            "Produce a compact summary that downstream agents can read."
+        ),
+        tools=[run_data_quality_checks_only],
+        output_key="dq_summary",
+    )
+
+
+@functools.cache
+def _build_pii_llm_agent() -> LlmAgent:
+    return LlmAgent(
+        name="PiiAgent",
+        model=GEMINI_MODEL,
+        description=(
+            "Specialist agent that focuses on PII detection and enforcement rules "
+            "for the analytics pipeline."
+        ),
+        instruction=(
+            "You are a privacy/PII governance expert.\n"
+            "Call the 'run_pii_policy_checks_only' tool once. Then:\n"
+            "1) Explain which columns are considered PII.\n"
+            "2) Describe what the pipeline did with each PII field "
+            "(kept in raw, removed in curated, etc.).\n"
+            "3) Flag any remaining PII in curated outputs and suggest how to fix it.\n"
+            "Schema and data quality checks run concurrently in other agents, so "
+            "don't rely on 'schema_summary' or 'dq_summary'; the report agent "
+            "combines the findings.\n"
+            "Return a structured summary suitable for a final report."
+        ),
+        tools=[run_pii_policy_checks_only],
+        output_key="pii_summary",
+    )
+
+
+@functools.cache
+def _build_report_llm_agent() -> LlmAgent:
+    return LlmAgent(
+        name="ReportAgent",
+        model=GEMINI_MODEL,
+        description=(
+            "Reporting agent that reads schema, data quality, and PII summaries "
+            "from shared state and produces an overall governance report."
+        ),
+        instruction=RUN_SUMMARY_INSTRUCTION,
+        tools=[],  # no direct tools; relies on shared state
+        output_key="governance_report",
+    )
+
+
+# Schema, DQ and PII specialists only read the raw data and write to distinct
+# output_keys, so they can run side by side; the report agent fans them back in.
+@functools.cache
+def _build_parallel_checks() -> ParallelAgent:
+    return ParallelAgent(
+        name="ParallelChecks",
+        description=(
+            "Runs the schema, data quality and PII specialist agents concurrently. "
+            "Each sub-agent writes its own summary key to session.state."
+        ),
+        sub_agents=[
+            _build_schema_llm_agent(),
+            _build_dq_llm_agent(),
+            _build_pii_llm_agent(),
+        ],
+    )
+
+
+@functools.cache
+def _build_governance_workflow() -> SequentialAgent:
+    return SequentialAgent(
+        name="GovernanceWorkflow",
+        description=(
+            "Runs the full multi-step governance workflow: "
+            "schema validation, data quality validation and PII policy checks in parallel → final reporting. "
+            "Each sub-agent writes its results to session.state."
+        ),
+        sub_agents=[
+            _build_parallel_checks(),
+            _build_report_llm_agent(),
+        ],
+    )
+
+
+@functools.cache
+def _build_root_agent() -> LlmAgent:
+    return LlmAgent(
+        name="DataGovernanceRoot",
+        model=GEMINI_MODEL,
+        description=(
+            "Root coordinator agent for the data governance pipeline. "
+            "You decide whether to run the full multi-agent workflow or call "
+            "individual tools based on the user's request."
+        ),
+        instruction=(
+            "You coordinate a data governance workflow for an event analytics pipeline.\n"
+            "- If the user asks to 'run the full pipeline', 'run full governance', "
+            "'validate everything', or similar, delegate to the 'GovernanceWorkflow' "
+            "sequential agent.\n"
+            "- Otherwise call the 'run_governance' tool with the matching mode:\n"
+            "  'schema' for schema-only questions, 'dq' for data quality, "
+            "'pii' for PII or privacy, 'full' for a quick full run without "
+            "the specialist agents, and 'report' to generate or save a "
+            "markdown report.\n"
+            "- If the user asks to 'auto-run', 'check for new data and run', or "
+            "similar, use mode 'auto'. This should be treated as an "
+            "idempotent, non-interactive run: if there is no new data, just report "
+            "that fact; if there is new data, run the pipeline and return where the "
+            "report was saved.\n"
+            "After calling a workflow or tool, explain the results clearly and suggest "
+            "concrete next steps. Do not try to add sub-agents yourself; use the "
+            "run_governance tool and the GovernanceWorkflow sub-agent."
+        ),
+        # One tool with an enum argument instead of six separate tools keeps
+        # the function declarations in the prompt small; the individual
+        # tools stay importable for the specialists and for tests.
+        tools=[run_governance],
+        sub_agents=[_build_governance_workflow()],
+    )
+
+
+# The LLM agents are built on first access (PEP 562) rather than at import, so
+# importing this module -- e.g. for the tool functions alone -- stays cheap.
+# Each builder is cached, so every name always resolves to the same instance
+# and ADK's one-parent-per-agent rule holds.
+_LAZY_AGENTS = {
+    "schema_llm_agent": _build_schema_llm_agent,
+    "dq_llm_agent": _build_dq_llm_agent,
+    "pii_llm_agent": _build_pii_llm_agent,
+    "report_llm_agent": _build_report_llm_agent,
+    "parallel_checks": _build_parallel_checks,
+    "governance_workflow": _build_governance_workflow,
+    "root_agent": _build_root_agent,
+}
+
+
+def __getattr__(name: str):
+    try:
+        return _LAZY_AGENTS[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_AGENTS))
@@ -5,8 +5,14 @@ Simple base class for pipeline agents.
 This is a lightweight abstraction we can later map to ADK agents.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+# Agents may run concurrently (see CoordinatorAgent); each one prints its
+# results report while holding this lock so reports don't interleave.
+PRINT_LOCK = threading.Lock()
 
 
 class BaseAgent(ABC):
@@ -22,3 +28,19 @@ class BaseAgent(ABC):
         Returns a dict containing structured results.
         """
         raise NotImplementedError
+
+
+def run_tasks(
+    tasks: Dict[str, Tuple[Callable[..., Dict[str, Any]], Dict[str, Any]]],
+    parallel: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run independent agent calls, given as name -> (fn, kwargs), and return
+    name -> result in the same order. With parallel=True they run in a
+    thread pool; pandas releases the GIL for most of the column work.
+    """
+    if not parallel or len(tasks) < 2:
+        return {name: fn(**kwargs) for name, (fn, kwargs) in tasks.items()}
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {name: pool.submit(fn, **kwargs) for name, (fn, kwargs) in tasks.items()}
+        return {name: fut.result() for name, fut in futures.items()}
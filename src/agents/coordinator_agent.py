@@ -5,11 +5,10 @@ High-level coordinator that runs the full governance pipeline
 using the other agents.
 """
 
+import functools
 from typing import Any, Dict, Optional
 
-import pandas as pd
-
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import PRINT_LOCK, BaseAgent, run_tasks
 from src.agents.schema_agent import SchemaValidationAgent
 from src.agents.dq_agent import DataQualityAgent
 from src.agents.pii_policy_agent import PiiPolicyAgent
@@ -17,13 +16,16 @@ from src.agents.pii_policy_agent import PiiPolicyAgent
 
 # Reuse the I/O helpers from run_pipeline
 from src.pipeline.run_pipeline import (
+    SCHEMA_FILES,
     load_config,
     load_schema,
     save_events_curated,
+    curated_out_dir,
     load_all_sources
 )
 from src.pipeline.foreign_keys import validate_foreign_keys
 
+
 class CoordinatorAgent(BaseAgent):
     def __init__(self) -> None:
         super().__init__(
@@ -44,23 +46,11 @@ class CoordinatorAgent(BaseAgent):
         else:
             config = load_config()
 
-        # Load all sources
-        dfs = load_all_sources(config)
-        df_events = dfs["events"]
-
-        # events_schema = load_schema("events_schema.json")
-        # events_filename = config["sources"]["events"]["filename"]
-
-        # print(f"\nLoaded raw events data from {events_filename}")
-        # print(f"Rows: {len(df_events)}, Columns: {list(df_events.columns)}")
-
-        # # Schema
-        # schema_results = self.schema_agent.run(df=df_events, schema=events_schema)
-
-        events_schema = load_schema("events_schema.json")
-        users_schema = load_schema("users_schema.json")
-        courses_schema = load_schema("courses_schema.json")
+        events_schema = load_schema(SCHEMA_FILES["events"])
+        users_schema = load_schema(SCHEMA_FILES["users"])
+        courses_schema = load_schema(SCHEMA_FILES["courses"])
 
+        # Load all sources (once; every check below reuses these frames)
         dfs = load_all_sources(config)
         df_events = dfs["events"]
         df_users = dfs.get("users")
@@ -68,22 +58,44 @@ class CoordinatorAgent(BaseAgent):
 
         events_filename = config["sources"]["events"]["filename"]
 
-        print(f"\nLoaded raw events data from {events_filename}")
-        print(f"Rows: {len(df_events)}, Columns: {list(df_events.columns)}")
-
-        schema_tables: Dict[str, Dict[str, Any]] = {}
-
-        events_schema_result = self.schema_agent.run(df=df_events, schema=events_schema)
-        schema_tables["events"] = events_schema_result
+        # One write under the print lock, so a concurrent agent report can't
+        # land between the two lines.
+        with PRINT_LOCK:
+            print(
+                f"\nLoaded raw events data from {events_filename}\n"
+                f"Rows: {len(df_events)}, Columns: {df_events.columns.tolist()}"
+            )
 
+        # Schema (per table), DQ, PII and FK checks only read the raw frames,
+        # so they can run side by side; saving waits for all of them.
+        dq_config = config.get("data_quality", {})
+        policy_config = config.get("policy", {})
+        fk_config = config.get("schema", {}).get("foreign_keys", [])
+        tasks = {
+            "schema_events": (self.schema_agent.run, {"df": df_events, "schema": events_schema}),
+            "dq": (self.dq_agent.run, {"df": df_events, "dq_config": dq_config}),
+            "pii": (
+                self.pii_agent.run,
+                {"df": df_events, "schema": events_schema, "policy_config": policy_config},
+            ),
+            "fk": (validate_foreign_keys, {"dfs": dfs, "fk_config": fk_config}),
+        }
         if df_users is not None:
-            users_schema_result = self.schema_agent.run(df=df_users, schema=users_schema)
-            schema_tables["users"] = users_schema_result
-
+            tasks["schema_users"] = (self.schema_agent.run, {"df": df_users, "schema": users_schema})
         if df_courses is not None:
-            courses_schema_result = self.schema_agent.run(df=df_courses, schema=courses_schema)
-            schema_tables["courses"] = courses_schema_result
-
+            tasks["schema_courses"] = (
+                self.schema_agent.run,
+                {"df": df_courses, "schema": courses_schema},
+            )
+
+        parallel = config.get("runtime", {}).get("parallel_agents", True)
+        results = run_tasks(tasks, parallel=parallel)
+
+        schema_tables: Dict[str, Dict[str, Any]] = {
+            name[len("schema_"):]: res
+            for name, res in results.items()
+            if name.startswith("schema_")
+        }
         schema_passed = all(tbl.get("passed") for tbl in schema_tables.values())
 
         schema_results = {
@@ -91,30 +103,20 @@ class CoordinatorAgent(BaseAgent):
             "tables": schema_tables,
         }
 
-
-        # Data quality
-        dq_config = config.get("data_quality", {})
-        dq_results = self.dq_agent.run(df=df_events, dq_config=dq_config)
-
-        # PII / policy
-        policy_config = config.get("policy", {})
-        pii_results = self.pii_agent.run(
-            df=df_events, schema=events_schema, policy_config=policy_config
-        )
+        dq_results = results["dq"]
+        pii_results = results["pii"]
         df_curated = pii_results["df_curated"]
-
-        # Foreign keys
-        fk_config = config.get("schema", {}).get("foreign_keys", [])
-        fk_results = validate_foreign_keys(dfs, fk_config)
+        fk_results = results["fk"]
 
         # Save curated
-        curated_filename = config["targets"]["events_curated"]["filename"]
-        save_events_curated(df_curated, curated_filename)
-
-        rows_in = len(df_events)
-        rows_out = len(df_curated)
-
-
+        curated_target = config["targets"]["events_curated"]
+        curated_filename = curated_target["filename"]
+        save_events_curated(
+            df_curated,
+            curated_filename,
+            curated_target.get("format"),
+            curated_out_dir(curated_target),
+        )
 
         return {
             "config": config,
@@ -122,6 +124,17 @@ class CoordinatorAgent(BaseAgent):
             "dq_results": dq_results,
             "pii_results": pii_results,
             "fk_results": fk_results,
+            # Raw events row count, so callers building a run summary don't
+            # re-read the source file for it.
+            "rows_in": len(df_events),
         }
 
 
+@functools.cache
+def get_coordinator() -> CoordinatorAgent:
+    """
+    Process-wide CoordinatorAgent. The coordinator and its sub-agents hold no
+    per-run state, so one instance can serve every run (and its
+    schema_agent / dq_agent / pii_agent can be used on their own).
+    """
+    return CoordinatorAgent()
@@ -7,7 +7,7 @@ Agent wrapper around data quality checks.
 from typing import Any, Dict
 import pandas as pd
 
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import PRINT_LOCK, BaseAgent
 from src.pipeline.data_quality import validate_data_quality, print_data_quality_results
 
 
@@ -18,7 +18,10 @@ class DataQualityAgent(BaseAgent):
             description="Performs data quality checks (nulls, uniques, enums).",
         )
 
-    def run(self, df: pd.DataFrame, dq_config: Dict[str, Any]) -> Dict[str, Any]:
-        results = validate_data_quality(df, dq_config)
-        print_data_quality_results(results)
+    def run(
+        self, df: pd.DataFrame, dq_config: Dict[str, Any], fail_fast: bool = False
+    ) -> Dict[str, Any]:
+        results = validate_data_quality(df, dq_config, fail_fast=fail_fast)
+        with PRINT_LOCK:
+            print_data_quality_results(results)
         return results
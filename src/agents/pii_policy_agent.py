@@ -7,7 +7,7 @@ Agent wrapper for PII / policy enforcement.
 from typing import Any, Dict
 import pandas as pd
 
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import PRINT_LOCK, BaseAgent
 from src.pipeline.policy_enforcement import enforce_pii_policy, print_pii_policy_results
 
 
@@ -25,5 +25,6 @@ class PiiPolicyAgent(BaseAgent):
         policy_config: Dict[str, Any],
     ) -> Dict[str, Any]:
         results = enforce_pii_policy(df, schema, policy_config)
-        print_pii_policy_results(results)
+        with PRINT_LOCK:
+            print_pii_policy_results(results)
         return results
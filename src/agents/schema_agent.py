@@ -7,7 +7,7 @@ Agent wrapper around schema validation logic.
 from typing import Any, Dict
 import pandas as pd
 
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import PRINT_LOCK, BaseAgent
 from src.pipeline.schema_validator import validate_schema, print_schema_validation_results
 
 
@@ -20,5 +20,6 @@ class SchemaValidationAgent(BaseAgent):
 
     def run(self, df: pd.DataFrame, schema: Dict[str, Any]) -> Dict[str, Any]:
         results = validate_schema(df, schema)
-        print_schema_validation_results(results)
+        with PRINT_LOCK:
+            print_schema_validation_results(results)
         return results
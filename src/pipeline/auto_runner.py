@@ -2,107 +2,127 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-import subprocess
-import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
-from src.pipeline.run_pipeline import load_config
+try:  # optional: faster JSON codec for the state file
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
+from src.pipeline.run_pipeline import (
+    load_config,
+    run_pipeline_and_return_summary,
+)
+from src.pipeline.run_summary import save_run_summary
 from src.pipeline.report_markdown import (
     build_markdown_from_summary,
     save_markdown_report,
 )
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 RAW_DIR = PROJECT_ROOT / "data" / "raw"
 STATE_DIR = PROJECT_ROOT / "data" / "state"
-STATE_DIR.mkdir(parents=True, exist_ok=True)
 STATE_PATH = STATE_DIR / "auto_runner_state.json"
 
 
+def _read_state_json() -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(STATE_PATH.read_bytes())
+    return json.loads(STATE_PATH.read_text())
+
+
+def _write_state_json(data: Dict[str, Any]) -> None:
+    # Both codecs produce the same 2-space indented layout.
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        STATE_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        STATE_PATH.write_text(json.dumps(data, indent=2))
+
+
 @dataclass
 class AutoRunState:
-    last_processed_mtime: float = 0.0
+    last_processed_mtime_ns: int = 0
     last_run_utc: str | None = None
     events_path: str | None = None
     last_report_path: str | None = None
+    last_summary_hash: str | None = None
 
     @classmethod
     def load(cls) -> "AutoRunState":
-        if not STATE_PATH.exists():
-            return cls()
         try:
-            data = json.loads(STATE_PATH.read_text())
+            data = _read_state_json()
+        except FileNotFoundError:
+            return cls()
         except Exception:
             # If the state file is corrupted, start fresh but don't crash.
             return cls()
+        mtime_ns = data.get("last_processed_mtime_ns")
+        if mtime_ns is None:
+            # State written before the switch to integer nanoseconds.
+            mtime_ns = int(data.get("last_processed_mtime", 0.0) * 1_000_000_000)
         return cls(
-            last_processed_mtime=data.get("last_processed_mtime", 0.0),
+            last_processed_mtime_ns=mtime_ns,
             last_run_utc=data.get("last_run_utc"),
             events_path=data.get("events_path"),
             last_report_path=data.get("last_report_path"),
+            last_summary_hash=data.get("last_summary_hash"),
         )
 
     def save(self) -> None:
         data = {
-            "last_processed_mtime": self.last_processed_mtime,
+            "last_processed_mtime_ns": self.last_processed_mtime_ns,
             "last_run_utc": self.last_run_utc,
             "events_path": self.events_path,
             "last_report_path": self.last_report_path,
+            "last_summary_hash": self.last_summary_hash,
         }
-        STATE_PATH.write_text(json.dumps(data, indent=2))
+        _write_state_json(data)
 
 
 def _get_events_path() -> Path:
     """Resolve the raw events CSV path from config."""
-    config = load_config()
-    events_cfg = config["sources"]["events"]
-    filename = events_cfg["filename"]
+    # load_config() only re-parses the YAML when the file has changed.
+    filename = load_config()["sources"]["events"]["filename"]
     # This mirrors how run_pipeline loads from data/raw/<filename>
     return RAW_DIR / filename
 
 
-def _extract_json(stdout: str) -> Dict[str, Any]:
-    """Pull the JSON blob out of run_pipeline --print-json output."""
-    start = stdout.find("{")
-    end = stdout.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        raise ValueError("Could not find JSON in run_pipeline output.")
-    json_str = stdout[start : end + 1]
-    return json.loads(json_str)
+def _summary_hash(summary: Dict[str, Any]) -> str:
+    """
+    Content hash of a run summary, ignoring its metadata block (the
+    generation timestamp differs on every run even when the results don't).
+    """
+    content = {k: v for k, v in summary.items() if k != "metadata"}
+    if orjson is not None:
+        payload = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(content, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def _run_pipeline_and_get_summary() -> Dict[str, Any]:
     """
-    Call `python -m src.pipeline.run_pipeline --print-json`
-    and return the parsed summary dict.
-    """
-    cmd = [sys.executable, "-m", "src.pipeline.run_pipeline", "--print-json"]
-    try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        return {
-            "status": "error",
-            "error": "run_pipeline_failed",
-            "detail": e.stderr or str(e),
-        }
+    Run the governance pipeline in this process and return its summary dict.
 
+    Calling run_pipeline directly (instead of spawning
+    `python -m src.pipeline.run_pipeline` and scraping the JSON back out of
+    its stdout) skips interpreter start-up, the re-import of pandas and the
+    agents, and the print/parse round trip of the summary.
+    """
     try:
-        summary = _extract_json(proc.stdout)
+        summary = run_pipeline_and_return_summary()
+        save_run_summary(summary)
     except Exception as e:
         return {
             "status": "error",
-            "error": "parse_error",
-            "detail": f"Failed to parse summary JSON: {e}",
-            "raw_output": proc.stdout,
+            "error": "run_pipeline_failed",
+            "detail": str(e),
         }
 
     summary.setdefault("status", "success")
@@ -117,7 +137,7 @@ def auto_run_once() -> Dict[str, Any]:
        last processed one (stored in data/state/auto_runner_state.json).
     2. If there is no new data, return a `no_new_data` status.
     3. If there is new data, run the full governance pipeline
-       (`run_pipeline --print-json`), build a markdown report, save it,
+       in-process, build a markdown report, save it,
        update state, and return a detailed result.
 
     This is safe to call repeatedly: when nothing changed it’s a cheap no-op.
@@ -126,7 +146,7 @@ def auto_run_once() -> Dict[str, Any]:
 
     events_path = _get_events_path()
     try:
-        current_mtime = events_path.stat().st_mtime
+        current_mtime_ns = events_path.stat().st_mtime_ns
     except FileNotFoundError:
         return {
             "status": "error",
@@ -134,14 +154,14 @@ def auto_run_once() -> Dict[str, Any]:
             "message": f"Events file not found: {events_path}",
         }
 
-    if current_mtime <= state.last_processed_mtime:
+    if current_mtime_ns <= state.last_processed_mtime_ns:
         # Nothing new since the last successful run
         return {
             "status": "no_new_data",
             "message": "No new raw events data since last auto-run.",
             "events_path": str(events_path),
-            "last_processed_mtime": state.last_processed_mtime,
-            "current_mtime": current_mtime,
+            "last_processed_mtime_ns": state.last_processed_mtime_ns,
+            "current_mtime_ns": current_mtime_ns,
             "last_run_utc": state.last_run_utc,
             "last_report_path": state.last_report_path,
         }
@@ -158,15 +178,25 @@ def auto_run_once() -> Dict[str, Any]:
             "events_path": str(events_path),
         }
 
-    # Build and save a markdown report from the summary
-    markdown = build_markdown_from_summary(summary)
-    report_path = save_markdown_report(markdown)
+    # Build and save a markdown report from the summary, unless the results
+    # are identical to the last run's and that report is still on disk.
+    summary_hash = _summary_hash(summary)
+    if (
+        summary_hash == state.last_summary_hash
+        and state.last_report_path
+        and Path(state.last_report_path).exists()
+    ):
+        report_path = state.last_report_path
+    else:
+        markdown = build_markdown_from_summary(summary)
+        report_path = save_markdown_report(markdown)
 
     # Update and persist state
-    state.last_processed_mtime = current_mtime
+    state.last_processed_mtime_ns = current_mtime_ns
     state.last_run_utc = datetime.now(timezone.utc).isoformat()
     state.events_path = str(events_path)
     state.last_report_path = str(report_path)
+    state.last_summary_hash = summary_hash
     state.save()
 
     return {
@@ -11,25 +11,38 @@ Checks implemented:
 - Allowed event types (from config)
 """
 
+import sys
 from typing import Dict, Any, List
 import pandas as pd
 
 
-def _null_fractions(df: pd.DataFrame) -> Dict[str, float]:
-    """Return null fraction per column."""
-    return {col: float(df[col].isna().mean()) for col in df.columns}
+def _null_counts(df: pd.DataFrame, columns: List[str]) -> Dict[str, int]:
+    """Return the number of nulls in each of ``columns``, in one frame-level pass."""
+    if not columns:
+        return {}
+    counts = df[columns].isna().sum(axis=0)
+    return {col: int(n) for col, n in counts.items()}
 
 
 def validate_data_quality(
     df: pd.DataFrame,
     dq_config: Dict[str, Any],
+    fail_fast: bool = False,
 ) -> Dict[str, Any]:
+    """
+    Run the configured data quality checks on ``df``.
+
+    With ``fail_fast=True`` the function returns as soon as one check
+    category fails, for callers that only need the pass/fail gate; later
+    categories are then left empty in the results.
+    """
     results: Dict[str, Any] = {
         "null_fractions": {},                  # col -> fraction
         "columns_exceeding_null_threshold": {},# col -> fraction
         "non_null_violations": {},             # col -> count of nulls
         "unique_key_violations": {},           # key or tuple -> count of duplicates
         "invalid_event_types": [],             # list of invalid event_type values
+        "null_event_types": 0,                 # rows with no event_type at all
         "passed": True,
     }
 
@@ -38,81 +51,113 @@ def validate_data_quality(
     unique_keys: List[str] = dq_config.get("unique_keys", [])
     allowed_event_types: List[str] = dq_config.get("allowed_event_types", [])
 
-    # ---- Null fraction per column ----
-    null_fracs = _null_fractions(df)
-    results["null_fractions"] = null_fracs
-
     # Only enforce threshold on configured important columns (if provided),
     # otherwise apply to all columns.
+    df_columns = set(df.columns)
     threshold_cols = dq_config.get("null_threshold_columns")
     if threshold_cols is None:
-        cols_to_check = list(null_fracs.keys())
+        cols_to_check = list(df.columns)
     else:
-        cols_to_check = [c for c in threshold_cols if c in df.columns]
+        cols_to_check = [c for c in threshold_cols if c in df_columns]
+    required_cols = [c for c in non_null_columns if c in df_columns]
+
+    # One null mask per column that some rule actually looks at; nullable
+    # columns outside the threshold list are never scanned.
+    null_counts = _null_counts(df, list(dict.fromkeys(cols_to_check + required_cols)))
+    n_rows = len(df)
+
+    # ---- Null fraction per column ----
+    null_fracs = {
+        col: (null_counts[col] / n_rows if n_rows else 0.0) for col in cols_to_check
+    }
+    results["null_fractions"] = null_fracs
 
     for col in cols_to_check:
-        frac = null_fracs.get(col, 0.0)
+        frac = null_fracs[col]
         if frac > max_null_fraction:
             results["columns_exceeding_null_threshold"][col] = frac
             results["passed"] = False
+    if fail_fast and not results["passed"]:
+        return results
 
     # ---- Non-null required columns ----
-    for col in non_null_columns:
-        if col in df.columns:
-            null_count = int(df[col].isna().sum())
-            if null_count > 0:
-                results["non_null_violations"][col] = null_count
-                results["passed"] = False
+    for col in required_cols:
+        null_count = null_counts[col]
+        if null_count > 0:
+            results["non_null_violations"][col] = null_count
+            results["passed"] = False
+    if fail_fast and not results["passed"]:
+        return results
 
     # ---- Unique key violations ----
     # For now, we support single-column keys from the config.
     for key_col in unique_keys:
-        if key_col in df.columns:
-            dup_mask = df.duplicated(subset=[key_col])
-            dup_count = int(dup_mask.sum())
+        if key_col in df_columns:
+            # Rows beyond the first for each value (NaN counted as one value),
+            # same as duplicated().sum() but without building a row mask.
+            dup_count = n_rows - int(df[key_col].nunique(dropna=False))
             if dup_count > 0:
                 results["unique_key_violations"][key_col] = dup_count
                 results["passed"] = False
+    if fail_fast and not results["passed"]:
+        return results
 
     # ---- Allowed event types (if configured) ----
-    if allowed_event_types and "event_type" in df.columns:
-        invalid_mask = ~df["event_type"].isin(allowed_event_types)
-        invalid_values = sorted(set(df.loc[invalid_mask, "event_type"]))
-        if invalid_values:
+    if allowed_event_types and "event_type" in df_columns:
+        event_types = df["event_type"]
+        # Encode against the allowed list: values outside it get code -1, so
+        # the check scans integer codes instead of the strings.
+        allowed_index = pd.Index(list(dict.fromkeys(allowed_event_types)))
+        codes = allowed_index.get_indexer(event_types)
+        # A missing event type isn't in the allowed list either; nulls are
+        # counted separately so the listed values stay sortable strings.
+        null_mask = event_types.isna().to_numpy()
+        invalid_mask = (codes == -1) & ~null_mask
+        if invalid_mask.any():
+            invalid_values = sorted(event_types[invalid_mask].unique().tolist())
             results["invalid_event_types"] = invalid_values
             results["passed"] = False
+        null_count = int(null_mask.sum())
+        if null_count:
+            results["null_event_types"] = null_count
+            results["passed"] = False
 
     return results
 
 
 def print_data_quality_results(results: Dict[str, Any]) -> None:
-    print("\n=== Data Quality Check Results ===")
+    lines: List[str] = ["\n=== Data Quality Check Results ==="]
 
     if results["passed"]:
-        print("✓ Data quality checks passed.")
+        lines.append("✓ Data quality checks passed.")
     else:
-        print("✗ Data quality checks failed.")
+        lines.append("✗ Data quality checks failed.")
 
     # Null fractions
-    print("\nNull fraction per column:")
+    lines.append("\nNull fraction per column:")
     for col, frac in results["null_fractions"].items():
-        print(f"  - {col}: {frac:.3f}")
+        lines.append(f"  - {col}: {frac:.3f}")
 
     if results["columns_exceeding_null_threshold"]:
-        print("\nColumns exceeding max null fraction threshold:")
+        lines.append("\nColumns exceeding max null fraction threshold:")
         for col, frac in results["columns_exceeding_null_threshold"].items():
-            print(f"  - {col}: {frac:.3f}")
+            lines.append(f"  - {col}: {frac:.3f}")
 
     if results["non_null_violations"]:
-        print("\nNon-null violations (required columns with nulls):")
+        lines.append("\nNon-null violations (required columns with nulls):")
         for col, count in results["non_null_violations"].items():
-            print(f"  - {col}: {count} null values")
+            lines.append(f"  - {col}: {count} null values")
 
     if results["unique_key_violations"]:
-        print("\nUnique key violations:")
+        lines.append("\nUnique key violations:")
         for key, dup_count in results["unique_key_violations"].items():
-            print(f"  - {key}: {dup_count} duplicate rows")
+            lines.append(f"  - {key}: {dup_count} duplicate rows")
 
     if results["invalid_event_types"]:
-        print("\nInvalid event_type values:")
-        print(f"  - {results['invalid_event_types']}")
+        lines.append("\nInvalid event_type values:")
+        lines.append(f"  - {results['invalid_event_types']}")
+    if results.get("null_event_types"):
+        lines.append(f"\nMissing event_type values: {results['null_event_types']} rows")
+
+    # One write for the whole report instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import Dict, List, Any
+import numpy as np
 import pandas as pd
 
+# How many missing keys each violation lists as examples.
+MAX_MISSING_KEY_EXAMPLES = 20
+
+
+def _is_int_key(series: pd.Series) -> bool:
+    """True for plain numpy integer columns (not nullable Int64 / objects)."""
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "iu"
+
 
 def validate_foreign_keys(
     dfs: Dict[str, pd.DataFrame],
@@ -42,6 +52,12 @@ def validate_foreign_keys(
       }
     """
     violations: List[Dict[str, Any]] = []
+    # (ref_table, ref_column) -> distinct parent keys, built once per call
+    # even when several foreign keys point at the same parent column.
+    parent_keys: Dict[tuple, Any] = {}
+    # (table, column) -> non-null child keys, likewise shared across configs
+    # that check the same child column against different parents.
+    child_keys: Dict[tuple, pd.Series] = {}
 
     for fk in fk_config:
         table = fk["table"]
@@ -56,19 +72,41 @@ def validate_foreign_keys(
         if df is None or df_ref is None:
             continue
 
-        child_vals = set(df[column].dropna().unique())
-        parent_vals = set(df_ref[ref_column].dropna().unique())
+        parent_key = (ref_table, ref_column)
+        parent_vals = parent_keys.get(parent_key)
+        if parent_vals is None:
+            parent_vals = parent_keys[parent_key] = pd.unique(
+                df_ref[ref_column].dropna().to_numpy()
+            )
+
+        child_key = (table, column)
+        child = child_keys.get(child_key)
+        if child is None:
+            child = child_keys[child_key] = df[column].dropna()
+        if _is_int_key(child) and _is_int_key(df_ref[ref_column]):
+            # Integer keys: sorted set difference on the raw numpy arrays.
+            # The result is sorted, so the first few are the smallest.
+            missing_arr = np.setdiff1d(
+                pd.unique(child.to_numpy()), parent_vals, assume_unique=True
+            )
+            examples = missing_arr[:MAX_MISSING_KEY_EXAMPLES].tolist()
+        else:
+            # isin hashes the parent keys once in C and probes the whole child
+            # column without boxing every value into a Python set.
+            missing_arr = child[~child.isin(parent_vals)].unique()
+            # the smallest few as examples; no need to sort them all
+            examples = heapq.nsmallest(MAX_MISSING_KEY_EXAMPLES, missing_arr.tolist())
 
-        missing = sorted(child_vals - parent_vals)
-        if missing:
+        missing_count = len(missing_arr)
+        if missing_count:
             violations.append(
                 {
                     "table": table,
                     "column": column,
                     "ref_table": ref_table,
                     "ref_column": ref_column,
-                    "missing_keys": missing[:20],  # cap examples
-                    "missing_count": len(missing),
+                    "missing_keys": examples,
+                    "missing_count": missing_count,
                 }
             )
 
@@ -8,16 +8,16 @@ Uses:
 - optional PII tags from the schema
 """
 
+import sys
 from typing import Dict, Any, List
 import pandas as pd
 
 
 def _pii_columns_from_schema(schema: Dict[str, Any]) -> List[str]:
-    pii_cols = []
-    for col in schema.get("columns", []):
-        if col.get("pii", False):
-            pii_cols.append(col["name"])
-    return pii_cols
+    columns = schema.get("columns")
+    if not columns:
+        return []
+    return [col["name"] for col in columns if col.get("pii", False)]
 
 
 def enforce_pii_policy(
@@ -33,27 +33,48 @@ def enforce_pii_policy(
       - remaining_pii_in_curated: list of PII cols still present (if any)
       - passed: bool
     """
-    df_curated = df.copy()
-
     # PII columns from config + schema tags
     config_pii_cols: List[str] = policy_config.get("pii_columns", [])
     schema_pii_cols: List[str] = _pii_columns_from_schema(schema)
-    detected_pii = sorted(set(config_pii_cols) | set(schema_pii_cols))
+    # Config columns first, then schema tags, each listed once in the order
+    # it was declared.
+    detected_pii = list(dict.fromkeys([*config_pii_cols, *schema_pii_cols]))
 
     pii_allowed_in_raw = policy_config.get("pii_allowed_in_raw", True)
     pii_allowed_in_curated = policy_config.get("pii_allowed_in_curated", False)
 
+    # No PII configured or tagged: nothing to drop or report, and the raw
+    # frame can be passed through as the curated one.
+    if not detected_pii:
+        return {
+            "df_curated": df,
+            "detected_pii_columns": [],
+            "removed_pii_columns": [],
+            "remaining_pii_in_curated": [],
+            "pii_allowed_in_raw": pii_allowed_in_raw,
+            "pii_allowed_in_curated": pii_allowed_in_curated,
+            "passed": True,
+        }
+
     removed_pii_columns: List[str] = []
+    # Column membership is tested against a set, kept in step with the drop.
+    col_set = set(df.columns)
 
-    # If PII is not allowed in curated, drop those columns
+    # If PII is not allowed in curated, drop those columns in a single
+    # vectorized drop; the curated frame is built directly from it rather
+    # than copying the raw frame first and then deleting from the copy.
     if not pii_allowed_in_curated:
-        for col in detected_pii:
-            if col in df_curated.columns:
-                df_curated.drop(columns=[col], inplace=True)
-                removed_pii_columns.append(col)
+        removed_pii_columns = [col for col in detected_pii if col in col_set]
+    if removed_pii_columns:
+        df_curated = df.drop(columns=removed_pii_columns)
+        col_set.difference_update(removed_pii_columns)
+    else:
+        # Nothing to remove: a new frame object over the same column data.
+        # The curated frame is only written out, never modified in place.
+        df_curated = df.copy(deep=False)
 
     # Check what PII columns (if any) are still in curated
-    remaining_pii = [c for c in detected_pii if c in df_curated.columns]
+    remaining_pii = [c for c in detected_pii if c in col_set]
 
     passed = len(remaining_pii) == 0 if not pii_allowed_in_curated else True
 
@@ -69,28 +90,31 @@ def enforce_pii_policy(
 
 
 def print_pii_policy_results(results: Dict[str, Any]) -> None:
-    print("\n=== PII / Policy Enforcement Results ===")
+    lines: List[str] = ["\n=== PII / Policy Enforcement Results ==="]
 
     if results["passed"]:
-        print("✓ PII policy enforcement passed.")
+        lines.append("✓ PII policy enforcement passed.")
     else:
-        print("✗ PII policy enforcement failed.")
+        lines.append("✗ PII policy enforcement failed.")
 
-    print("\nDetected PII columns (from config/schema):")
+    lines.append("\nDetected PII columns (from config/schema):")
     if results["detected_pii_columns"]:
         for col in results["detected_pii_columns"]:
-            print(f"  - {col}")
+            lines.append(f"  - {col}")
     else:
-        print("  (none)")
+        lines.append("  (none)")
 
-    print("\nRemoved PII columns from curated data:")
+    lines.append("\nRemoved PII columns from curated data:")
     if results["removed_pii_columns"]:
         for col in results["removed_pii_columns"]:
-            print(f"  - {col}")
+            lines.append(f"  - {col}")
     else:
-        print("  (none)")
+        lines.append("  (none)")
 
     if results["remaining_pii_in_curated"]:
-        print("\nWARNING: PII columns still present in curated data:")
+        lines.append("\nWARNING: PII columns still present in curated data:")
         for col in results["remaining_pii_in_curated"]:
-            print(f"  - {col}")
+            lines.append(f"  - {col}")
+
+    # One write for the whole report instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -2,18 +2,61 @@
 
 from __future__ import annotations
 
+import io
+import itertools
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, Optional
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 REPORTS_DIR = PROJECT_ROOT / "reports"
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-def build_markdown_from_summary(summary: Dict[str, Any]) -> str:
+# Status labels, indexed by the (bool) check result.
+_STATUS = {True: "✅ Passed", False: "❌ Failed"}
+_OVERALL = {True: "✅ PASSED", False: "❌ FAILED"}
+
+# Example rows listed per violation type.
+_MAX_EXAMPLES = 5
+
+
+def _fraction_rows(fractions: Dict[str, float]) -> str:
     """
-    Convert a governance summary dict into a human-readable markdown report.
-    Assumes the structure produced by CoordinatorAgent / RunSummaryAgent.
+    "  - `col`: 0.123" rows for a column -> fraction mapping. The numbers are
+    formatted in one vectorized call (float64, so rounding matches :.3f).
+    """
+    values = np.fromiter(fractions.values(), dtype=np.float64, count=len(fractions))
+    formatted = np.char.mod("%.3f", values)
+    return "".join(f"  - `{col}`: {text}\n" for col, text in zip(fractions, formatted))
+
+
+def _example_rows(items: Any) -> str:
+    """
+    Up to _MAX_EXAMPLES "  - ..." rows. Accepts a list of values or a
+    column -> count mapping (as the DQ results store violations).
+    """
+    if isinstance(items, dict):
+        rows = (f"  - `{col}`: {count}\n" for col, count in items.items())
+    else:
+        rows = (f"  - {item}\n" for item in items)
+    return "".join(itertools.islice(rows, _MAX_EXAMPLES))
+
+
+def _take(buf: io.StringIO) -> str:
+    """Return the buffered section text and reset the buffer for the next one."""
+    text = buf.getvalue()
+    buf.seek(0)
+    buf.truncate()
+    return text
+
+
+def iter_markdown_sections(summary: Dict[str, Any]) -> Iterator[str]:
+    """
+    Yield the governance markdown report one section at a time.
+
+    Joining the chunks gives exactly build_markdown_from_summary(summary);
+    callers that write or preview the report can consume it incrementally.
     """
 
     overall_passed: bool = summary.get("overall_passed", False)
@@ -21,164 +64,225 @@ def build_markdown_from_summary(summary: Dict[str, Any]) -> str:
     schema = checks.get("schema", {})
     dq = checks.get("data_quality", {})
     pii = checks.get("pii_policy", {})
+    fk = checks.get("foreign_keys", {})
+
+    # Per-check flags, read once up front.
+    schema_passed = bool(schema.get("passed"))
+    dq_passed = bool(dq.get("passed"))
+    fk_passed = bool(fk.get("passed"))
+    pii_passed = bool(pii.get("passed"))
 
     lineage = summary.get("lineage", {})
     source = lineage.get("source", {})
     target = lineage.get("target", {})
 
     # Top-level status
-    status = "✅ PASSED" if overall_passed else "❌ FAILED"
+    status = _OVERALL[bool(overall_passed)]
 
-    lines = []
+    # Each section is written into one buffer and yielded when complete.
+    buf = io.StringIO()
+    w = buf.write
 
     # Title + status
-    lines.append("# Data Pipeline Governance Report")
-    lines.append("")
-    lines.append(f"**Overall Status:** {status}")
-    lines.append("")
-    lines.append(f"- **Run ID:** `{summary.get('run_id', 'unknown')}`")
-    lines.append(f"- **Description:** {summary.get('description', 'N/A')}")
-    lines.append("")
+    w("# Data Pipeline Governance Report\n\n")
+    w(f"**Overall Status:** {status}\n\n")
+    w(f"- **Run ID:** `{summary.get('run_id', 'unknown')}`\n")
+    w(f"- **Description:** {summary.get('description', 'N/A')}\n\n")
+
+    yield _take(buf)
 
     # Lineage
-    lines.append("## Dataset Lineage")
-    lines.append("")
-    lines.append(f"- **Source file:** `{source.get('filename', 'unknown')}`")
-    lines.append(f"- **Rows in (raw):** {source.get('rows_in', 'unknown')}")
-    lines.append(f"- **Target file:** `{target.get('filename', 'unknown')}`")
-    lines.append(f"- **Rows out (curated):** {target.get('rows_out', 'unknown')}")
-    lines.append("")
+    w("## Dataset Lineage\n\n")
+    w(f"- **Source file:** `{source.get('filename', 'unknown')}`\n")
+    w(f"- **Rows in (raw):** {source.get('rows_in', 'unknown')}\n")
+    w(f"- **Target file:** `{target.get('filename', 'unknown')}`\n")
+    w(f"- **Rows out (curated):** {target.get('rows_out', 'unknown')}\n\n")
+
+    yield _take(buf)
 
     # Schema section
-    lines.append("## Schema Validation")
-    lines.append(f"- **Overall status:** {'✅ Passed' if schema.get('passed') else '❌ Failed'}")
-    lines.append("")
+    w("## Schema Validation\n")
+    w(f"- **Overall status:** {_STATUS[schema_passed]}\n\n")
 
     tables = schema.get("tables") or {}
     if tables:
-        lines.append("### Per-table schema status")
-        for table_name, table_result in tables.items():
-            t_status = "✅ Passed" if table_result.get("passed") else "❌ Failed"
-            lines.append(f"- **{table_name}**: {t_status}")
-        lines.append("")
-        
+        w("### Per-table schema status\n")
+        w("".join(
+            f"- **{table_name}**: {_STATUS[bool(table_result.get('passed'))]}\n"
+            for table_name, table_result in tables.items()
+        ))
+        w("\n")
+
     missing_cols = schema.get("missing_columns") or []
     extra_cols = schema.get("extra_columns") or []
     invalid_vals = schema.get("invalid_values") or {}
 
     if missing_cols or extra_cols or invalid_vals:
-        lines.append("")
+        w("\n")
         if missing_cols:
-            lines.append("- **Missing columns:** " + ", ".join(f"`{c}`" for c in missing_cols))
+            w("- **Missing columns:** " + ", ".join(f"`{c}`" for c in missing_cols) + "\n")
         if extra_cols:
-            lines.append("- **Extra columns:** " + ", ".join(f"`{c}`" for c in extra_cols))
+            w("- **Extra columns:** " + ", ".join(f"`{c}`" for c in extra_cols) + "\n")
         if invalid_vals:
-            lines.append("- **Columns with invalid values:**")
+            w("- **Columns with invalid values:**\n")
             for col, vals in invalid_vals.items():
                 # vals might be a list or count; handle generically
-                lines.append(f"  - `{col}`: {vals}")
+                if isinstance(vals, list):
+                    vals = sorted(vals)
+                w(f"  - `{col}`: {vals}\n")
     else:
-        lines.append("")
-        lines.append("No schema issues detected.")
-    lines.append("")
+        w("\nNo schema issues detected.\n")
+    w("\n")
+
+    yield _take(buf)
 
     # Data quality section
-    lines.append("## Data Quality Checks")
-    lines.append(f"- **Status:** {'✅ Passed' if dq.get('passed') else '❌ Failed'}")
-    lines.append("")
+    w("## Data Quality Checks\n")
+    w(f"- **Status:** {_STATUS[dq_passed]}\n\n")
     null_fracs = dq.get("null_fractions") or {}
     exceeding = dq.get("columns_exceeding_null_threshold") or {}
     non_null_viol = dq.get("non_null_violations") or []
     unique_viol = dq.get("unique_key_violations") or []
     invalid_event_types = dq.get("invalid_event_types") or []
+    null_event_types = dq.get("null_event_types") or 0
 
     if null_fracs:
-        lines.append("- **Null fraction per column:**")
-        for col, frac in null_fracs.items():
-            lines.append(f"  - `{col}`: {frac:.3f}")
+        w("- **Null fraction per column:**\n")
+        w(_fraction_rows(null_fracs))
     if exceeding:
-        lines.append("- **Columns exceeding null threshold:**")
-        for col, frac in exceeding.items():
-            lines.append(f"  - `{col}`: {frac:.3f}")
+        w("- **Columns exceeding null threshold:**\n")
+        w(_fraction_rows(exceeding))
     if non_null_viol:
-        lines.append("- **Non-null violations (examples):**")
-        for item in non_null_viol[:5]:
-            lines.append(f"  - {item}")
+        w("- **Non-null violations (examples):**\n")
+        w(_example_rows(non_null_viol))
     if unique_viol:
-        lines.append("- **Unique key violations (examples):**")
-        for item in unique_viol[:5]:
-            lines.append(f"  - {item}")
+        w("- **Unique key violations (examples):**\n")
+        w(_example_rows(unique_viol))
     if invalid_event_types:
-        lines.append("- **Invalid event_type values (examples):**")
-        for item in invalid_event_types[:5]:
-            lines.append(f"  - {item}")
-    if not (null_fracs or exceeding or non_null_viol or unique_viol or invalid_event_types):
-        lines.append("No data quality issues detected.")
-    lines.append("")
+        # The summary already holds at most a few examples, plus the total.
+        total = dq.get("invalid_event_types_total", len(invalid_event_types))
+        shown = min(len(invalid_event_types), _MAX_EXAMPLES)
+        suffix = f" (showing {shown} of {total})" if total > shown else ""
+        w(f"- **Invalid event_type values (examples):**{suffix}\n")
+        w(_example_rows(invalid_event_types))
+    if null_event_types:
+        w(f"- **Missing event_type values:** {null_event_types} rows\n")
+    if not (
+        null_fracs
+        or exceeding
+        or non_null_viol
+        or unique_viol
+        or invalid_event_types
+        or null_event_types
+    ):
+        w("No data quality issues detected.\n")
+    w("\n")
 
-    fk = checks.get("foreign_keys", {})
+    yield _take(buf)
 
-    lines.append("## Cross-Table / Foreign Key Checks")
-    lines.append(f"- **Status:** {'✅ Passed' if fk.get('passed') else '❌ Failed'}")
-    lines.append("")
+    w("## Cross-Table / Foreign Key Checks\n")
+    w(f"- **Status:** {_STATUS[fk_passed]}\n\n")
     violations = fk.get("violations") or []
     if violations:
-        lines.append("- **Violations:**")
-        for v in violations:
-            lines.append(
-                f"  - `{v['table']}.{v['column']}` has values not found in "
-                f"`{v['ref_table']}.{v['ref_column']}` "
-                f"(examples: {v['missing_keys']})"
-            )
+        w("- **Violations:**\n")
+        w("".join(
+            f"  - `{v['table']}.{v['column']}` has values not found in "
+            f"`{v['ref_table']}.{v['ref_column']}` "
+            f"(examples: {v['missing_keys']})\n"
+            for v in violations
+        ))
     else:
-        lines.append("No foreign key violations detected.")
-    lines.append("")
+        w("No foreign key violations detected.\n")
+    w("\n")
 
+    yield _take(buf)
 
     # PII / policy section
-    lines.append("## PII / Policy Enforcement")
-    lines.append(f"- **Status:** {'✅ Passed' if pii.get('passed') else '❌ Failed'}")
-    lines.append("")
+    w("## PII / Policy Enforcement\n")
+    w(f"- **Status:** {_STATUS[pii_passed]}\n\n")
     detected = pii.get("detected_pii_columns") or []
     removed = pii.get("removed_pii_columns") or []
     remaining = pii.get("remaining_pii_in_curated") or []
 
-    lines.append("- **Detected PII columns in raw:** " +
-                 (", ".join(f"`{c}`" for c in detected) if detected else "None"))
-    lines.append("- **Removed from curated:** " +
-                 (", ".join(f"`{c}`" for c in removed) if removed else "None"))
-    lines.append("- **Remaining PII in curated:** " +
-                 (", ".join(f"`{c}`" for c in remaining) if remaining else "None"))
-    lines.append("")
+    w("- **Detected PII columns in raw:** " +
+      (", ".join(f"`{c}`" for c in detected) if detected else "None") + "\n")
+    w("- **Removed from curated:** " +
+      (", ".join(f"`{c}`" for c in removed) if removed else "None") + "\n")
+    w("- **Remaining PII in curated:** " +
+      (", ".join(f"`{c}`" for c in remaining) if remaining else "None") + "\n\n")
+
+    yield _take(buf)
 
     # Recommendations (very simple, driven by flags)
-    lines.append("## Recommendations")
-    lines.append("")
+    recommendations = []
     if not overall_passed:
-        lines.append("- Investigate and resolve the failing checks above, then rerun the pipeline.")
+        recommendations.append("Investigate and resolve the failing checks above, then rerun the pipeline.")
     if missing_cols:
-        lines.append("- Align upstream event producers to include all required schema columns.")
+        recommendations.append("Align upstream event producers to include all required schema columns.")
     if exceeding:
-        lines.append("- Reduce nulls in critical columns (e.g., enforce required fields at write time).")
+        recommendations.append("Reduce nulls in critical columns (e.g., enforce required fields at write time).")
     if remaining:
-        lines.append("- Remove or hash remaining PII fields from curated outputs to satisfy policy.")
-    if not lines[-1].startswith("-"):
-        lines.append("- No major governance issues detected. Continue monitoring for regressions.")
-    lines.append("")
+        recommendations.append("Remove or hash remaining PII fields from curated outputs to satisfy policy.")
+    if not recommendations:
+        recommendations.append("No major governance issues detected. Continue monitoring for regressions.")
+
+    w("## Recommendations\n\n")
+    for item in recommendations:
+        w(f"- {item}\n")
+
+    yield _take(buf)
 
-    return "\n".join(lines)
+
+def build_markdown_from_summary(summary: Dict[str, Any]) -> str:
+    """
+    Convert a governance summary dict into a human-readable markdown report.
+    Assumes the structure produced by CoordinatorAgent / RunSummaryAgent.
+    """
+    return "".join(iter_markdown_sections(summary))
 
 
 
-def save_markdown_report(markdown: str, timestamp: str | None = None) -> Path:
+def save_markdown_report(
+    markdown: str | Iterable[str],
+    timestamp: str | None = None,
+    out_dir: Path | None = None,
+) -> Path:
     """
-    Save the markdown report to reports/governance_report_<timestamp>.md.
+    Save the markdown report to reports/governance_report_<timestamp>.md
+    (or to out_dir instead of reports/, when given).
 
+    `markdown` may be the full text or an iterable of chunks (e.g. from
+    iter_markdown_sections), which is written as it is produced.
     If timestamp is not provided, a new UTC timestamp is generated.
     """
     if timestamp is None:
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    if out_dir is None:
+        out_dir = REPORTS_DIR
 
-    report_path = REPORTS_DIR / f"governance_report_{timestamp}.md"
-    report_path.write_text(markdown, encoding="utf-8")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    report_path = out_dir / f"governance_report_{timestamp}.md"
+    if isinstance(markdown, str):
+        report_path.write_text(markdown, encoding="utf-8")
+    else:
+        with report_path.open("w", encoding="utf-8") as f:
+            f.writelines(markdown)
     return report_path
+
+
+def markdown_preview(markdown: str, max_lines: int = 40) -> str:
+    """
+    Return the first `max_lines` lines of `markdown`, newline-joined.
+
+    Same result as "\n".join(markdown.splitlines()[:max_lines]) for
+    "\n"-separated text, but only scans up to the last line it keeps
+    instead of splitting the whole report.
+    """
+    if max_lines <= 0:
+        return ""
+    end = -1
+    for _ in range(max_lines):
+        end = markdown.find("\n", end + 1)
+        if end == -1:
+            return markdown[:-1] if markdown.endswith("\n") else markdown
+    return markdown[:end]
@@ -11,32 +11,89 @@ For now, this script will:
 Later, this will be orchestrated by the multi-agent system.
 """
 
+import functools
 import json
+import os
 import pathlib
-from typing import Dict, Any
+import re
+import threading
+from typing import Dict, Any, Optional
 
 import pandas as pd
 import numpy as np
 import yaml
 
-from src.agents.dq_agent import DataQualityAgent
-from src.agents.pii_policy_agent import PiiPolicyAgent
-from src.agents.schema_agent import SchemaValidationAgent
+try:  # optional: multi-threaded Arrow CSV reader + Parquet parse cache
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pandas' own parser is the fallback
+    pa = None
+    pc = None
+    pa_csv = None
+    pq = None
+
+from src.agents.base_agent import run_tasks
 from src.pipeline.run_summary import build_run_summary, save_run_summary, print_run_summary
 from src.pipeline.foreign_keys import validate_foreign_keys
 
 
 
 
-BASE_DIR = pathlib.Path(__file__).resolve().parents[2]  # repo root
+BASE_DIR = pathlib.Path(__file__).parent.parent.parent  # repo root
 DATA_DIR = BASE_DIR / "data"
 CONFIG_DIR = BASE_DIR / "config"
 SCHEMA_DIR = DATA_DIR / "schema"
 RAW_DIR = DATA_DIR / "raw"
 CURATED_DIR = DATA_DIR / "curated"
+CSV_CACHE_DIR = DATA_DIR / "cache"  # Parquet copies of parsed raw CSVs
 REPORTS_DIR = BASE_DIR / "reports"
 LOGS_DIR = BASE_DIR / "logs"
 
+# Schema file (under SCHEMA_DIR) for each source table a run validates.
+SCHEMA_FILES = {
+    "events": "events_schema.json",
+    "users": "users_schema.json",
+    "courses": "courses_schema.json",
+}
+
+
+# libyaml's C loader when PyYAML was built with it; same safe subset either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML/JSON file once per (path, mtime). Editing the file changes
+    its mtime and therefore the key, so stale entries are never returned.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _clone(obj: Any) -> Any:
+    """
+    Copy of a parsed YAML/JSON document: containers are rebuilt, scalar
+    leaves (str, numbers, dates) are immutable and shared. Much cheaper
+    than copy.deepcopy, which keeps a memo of every node it visits.
+    """
+    if isinstance(obj, dict):
+        return {k: _clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clone(v) for v in obj]
+    if isinstance(obj, set):  # YAML !!set
+        return set(obj)
+    return obj
+
+
+def _load_cached(path: pathlib.Path) -> Dict[str, Any]:
+    # Hand out a copy so callers can't modify the cached object.
+    return _clone(_parse_file(str(path), path.stat().st_mtime_ns))
+
 
 def load_config(filename: str = "pipeline_config.yaml") -> Dict[str, Any]:
     """
@@ -45,20 +102,212 @@ def load_config(filename: str = "pipeline_config.yaml") -> Dict[str, Any]:
     Args:
         filename: name of the file in the config/ directory (defaults to pipeline_config.yaml)
     """
-    config_path = CONFIG_DIR / filename
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_cached(CONFIG_DIR / filename)
 
 
 def load_schema(schema_name: str) -> Dict[str, Any]:
-    schema_path = SCHEMA_DIR / schema_name
-    with open(schema_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_cached(SCHEMA_DIR / schema_name)
+
+
+def schema_file_stats() -> tuple:
+    """(table, mtime_ns, size) of every schema file a run loads, for cache keys."""
+    stats = []
+    for table, schema_name in SCHEMA_FILES.items():
+        st = (SCHEMA_DIR / schema_name).stat()
+        stats.append((table, st.st_mtime_ns, st.st_size))
+    return tuple(stats)
+
+
+# pandas' default NA markers, so the Arrow reader nulls the same cells
+# pd.read_csv would.
+_CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+# Bumped whenever _read_csv_table's output changes, so cached copies made by
+# an older reader are not served.
+_CSV_CACHE_VERSION = 3
+
+# Bytes per parse block; blocks are tokenized in parallel across threads.
+_CSV_BLOCK_SIZE = 1 << 20
+
+
+# Integers this large don't fit int64: pyarrow reads them as lossy doubles
+# where pandas keeps uint64 or the original text.
+_INT64_LIMIT = 2**63
+
+
+def _is_temporal(data_type) -> bool:
+    return (
+        pa.types.is_date(data_type)
+        or pa.types.is_time(data_type)
+        or pa.types.is_timestamp(data_type)
+    )
+
+
+def _read_csv_table(path: pathlib.Path):
+    """
+    Parse a raw CSV into an Arrow table with pyarrow's multi-threaded reader.
+
+    The reader is set up to match pd.read_csv's result: the same NA markers
+    and boolean spellings, empty strings as nulls, and no timestamp
+    inference (the timestamp parser list holds a format that never matches).
+    Columns Arrow still infers as dates or times are read again as strings,
+    as pandas leaves them, and all-empty columns as float64 (pandas' NaN
+    column) rather than Arrow's null type.
+
+    Returns None for files the Arrow reader can't reproduce pd.read_csv for
+    (duplicate or empty header names, which pandas renames; integers past
+    the int64 range), so the caller falls back to pandas. Rows the Arrow
+    parser rejects (e.g. short rows, which pandas pads with NaN) raise
+    pa.ArrowInvalid.
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=_CSV_BLOCK_SIZE)
+    convert_options = pa_csv.ConvertOptions(
+        null_values=_CSV_NA_VALUES,
+        strings_can_be_null=True,
+        timestamp_parsers=["\x00"],
+        true_values=["True", "TRUE", "true"],
+        false_values=["False", "FALSE", "false"],
+    )
+    table = pa_csv.read_csv(
+        path, read_options=read_options, convert_options=convert_options
+    )
+
+    names = table.column_names
+    if len(set(names)) != len(names) or not all(names):
+        return None
+
+    column_types = {}
+    for field in table.schema:
+        if _is_temporal(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            column_types[field.name] = pa.float64()
+    if column_types:
+        convert_options.column_types = column_types
+        table = pa_csv.read_csv(
+            path, read_options=read_options, convert_options=convert_options
+        )
+
+    for field in table.schema:
+        if pa.types.is_floating(field.type):
+            largest = pc.max(pc.abs(table[field.name])).as_py()
+            if largest is not None and largest >= _INT64_LIMIT:
+                return None
+    return table
+
+
+def _cached_csv_table(path: pathlib.Path, filename: str):
+    """
+    Arrow table for a raw CSV, served from a Parquet copy under
+    data/cache/ when the CSV hasn't changed since it was parsed.
+
+    The cache file name carries the CSV's (mtime_ns, size) and the reader
+    version, so a modified CSV (or a change to how CSVs are read) misses;
+    older copies for the same file are removed when the new one is written.
+    Returns None when the CSV has to be read by pandas instead (see
+    _read_csv_table).
+    """
+    st = path.stat()
+    cache_path = CSV_CACHE_DIR / (
+        f"{filename}.{st.st_mtime_ns}_{st.st_size}.v{_CSV_CACHE_VERSION}.parquet"
+    )
+    try:
+        return pq.read_table(cache_path)
+    except FileNotFoundError:
+        pass
+
+    try:
+        table = _read_csv_table(path)
+    except pa.ArrowInvalid:
+        # Arrow's parser is stricter than pandas' (ragged rows); let
+        # pd.read_csv handle the file.
+        return None
+    if table is None:
+        return None
+    try:
+        _write_csv_cache(table, cache_path, filename)
+    except OSError:
+        # The cache is best-effort (read-only checkout, permissions, full
+        # disk): the CSV has been parsed either way.
+        pass
+    return table
+
+
+def _write_csv_cache(table, cache_path: pathlib.Path, filename: str) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Only this file's own copies (<name>.<mtime_ns>_<size>.v<N>.parquet): a
+    # plain "<name>.*" glob would also match e.g. events.csv.2024.csv's cache.
+    name = re.escape(pathlib.Path(filename).name)
+    own_copy = re.compile(rf"{name}\.\d+_\d+\.v\d+\.parquet")
+    for stale in cache_path.parent.iterdir():
+        if own_copy.fullmatch(stale.name):
+            stale.unlink(missing_ok=True)
+    # Write under a temporary name and rename, so a concurrent reader never
+    # sees a half-written file.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def load_events_raw(filename: str) -> pd.DataFrame:
     events_path = RAW_DIR / filename
-    return pd.read_csv(events_path)
+    table = _cached_csv_table(events_path, filename) if pa_csv is not None else None
+    if table is None:
+        return pd.read_csv(events_path)
+    # The table isn't used again, so its buffers can be released column by
+    # column while converting.
+    return table.to_pandas(self_destruct=True)
+
+
+def count_events_rows(filename: str) -> int:
+    """
+    Number of data rows in a raw CSV, as len(load_events_raw(filename)) would
+    report it, without converting the file to a DataFrame. Rows are counted
+    by the CSV parser rather than by newlines, so quoted multi-line fields
+    and a missing trailing newline are counted the same way.
+    """
+    events_path = RAW_DIR / filename
+    table = _cached_csv_table(events_path, filename) if pa_csv is not None else None
+    if table is None:
+        return len(pd.read_csv(events_path, usecols=[0]))
+    return table.num_rows
+
+
+def optimize_dtypes(
+    df: pd.DataFrame, max_category_ratio: float = 0.5
+) -> pd.DataFrame:
+    """
+    Return a copy of ``df`` with smaller column dtypes, for frames that are
+    kept around and scanned repeatedly (e.g. the ADK tools' cached events):
+
+    - integer columns are downcast to the narrowest integer type that fits;
+    - string columns whose distinct values are under ``max_category_ratio``
+      of the rows (event_type, course_id, ...) become ``category``, so isin /
+      duplicated / unique work on small integer codes.
+
+    Float columns are left alone: downcasting them would change values.
+    Values are otherwise unchanged (same nulls, same strings).
+    """
+    n_rows = len(df)
+    converted = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            converted[col] = pd.to_numeric(series, downcast="integer")
+        elif n_rows and (
+            pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+        ):
+            if series.nunique(dropna=True) < max_category_ratio * n_rows:
+                converted[col] = series.astype("category")
+    return df.assign(**converted) if converted else df
+
 
 def load_all_sources(config: Dict) -> Dict[str, pd.DataFrame]:
     """
@@ -82,63 +331,128 @@ def load_all_sources(config: Dict) -> Dict[str, pd.DataFrame]:
 
     return dfs
 
-def save_events_curated(df: pd.DataFrame, filename: str) -> None:
-    CURATED_DIR.mkdir(parents=True, exist_ok=True)
-    out_path = CURATED_DIR / filename
-    df.to_csv(out_path, index=False)
+def save_events_curated(
+    df: pd.DataFrame,
+    filename: str,
+    file_format: Optional[str] = None,
+    out_dir: Optional[pathlib.Path] = None,
+) -> None:
+    """
+    Write the curated events to data/curated/<filename> (or to out_dir
+    instead of data/curated, when given; targets.events_curated.dir).
+
+    ``file_format`` is ``"csv"`` or ``"parquet"`` (targets.events_curated.format
+    in the config); when unset it follows the file extension. Any other
+    value raises ValueError. Parquet is written Snappy-compressed.
+
+    CSV goes through pyarrow's vectorized writer when available, else
+    pandas' to_csv in row chunks (also used for frames Arrow can't convert,
+    e.g. object columns mixing types). The two writers spell some values
+    differently: pyarrow quotes string fields, writes booleans as
+    true/false and whole-number floats without ".0" (so pd.read_csv reads
+    such a column back as int64, not float64).
+    """
+    if out_dir is None:
+        out_dir = CURATED_DIR
+    out_path = out_dir / filename
+    if file_format is None:
+        file_format = "parquet" if out_path.suffix == ".parquet" else "csv"
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(
+            f"Unsupported curated format {file_format!r} (expected 'csv' or 'parquet')"
+        )
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if file_format == "parquet":
+        df.to_parquet(out_path, engine="pyarrow", compression="snappy", index=False)
+    elif not _write_csv_arrow(df, out_path):
+        df.to_csv(out_path, index=False, chunksize=100_000)
     print(f"\nSaved curated events data to {out_path}")
 
 
-def main():
-    config = load_config()
+def _write_csv_arrow(df: pd.DataFrame, out_path: pathlib.Path) -> bool:
+    """Write df as CSV with pyarrow; False if pyarrow is missing or can't convert df."""
+    if pa_csv is None:
+        return False
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+    write_options = pa_csv.WriteOptions(batch_size=65536, quoting_style="needed")
+    pa_csv.write_csv(table, out_path, write_options=write_options)
+    return True
 
-    # Load all source tables
-    dfs = load_all_sources(config)
-    df_raw = dfs["events"]  # main fact table
 
-    # events_schema = load_schema("events_schema.json")
-    # source_filename = config["sources"]["events"]["filename"]
+def curated_out_dir(curated_target: Dict[str, Any]) -> Optional[pathlib.Path]:
+    """The targets.events_curated.dir override as a Path (None if unset)."""
+    out_dir = curated_target.get("dir")
+    return pathlib.Path(out_dir) if out_dir else None
 
-    # print(f"Loaded raw events data from {source_filename}")
-    # print(f"Rows: {len(df_raw)}, Columns: {list(df_raw.columns)}")
 
-    # # === Schema validation (events only, for CLI path) ===
-    # schema_agent = SchemaValidationAgent()
-    # schema_results = schema_agent.run(df=df_raw, schema=events_schema)
+def run_pipeline_and_return_summary() -> Dict[str, Any]:
+    """
+    Run the full governance pipeline with the default config: validate every
+    source table, enforce the PII policy, check foreign keys and save the
+    curated events. Returns the JSON-friendly run summary (not yet saved).
+
+    The agents still print their per-check reports; the summary itself is
+    returned rather than printed, so in-process callers (e.g. the auto-runner)
+    don't have to parse it back out of stdout.
+    """
+    config = load_config()
 
     # === Load all source tables ===
     dfs = load_all_sources(config)
-    df_events = dfs["events"]
+    df_events = dfs["events"]  # main fact table
     df_users = dfs.get("users")
     df_courses = dfs.get("courses")
 
-    events_schema = load_schema("events_schema.json")
-    users_schema = load_schema("users_schema.json")
-    courses_schema = load_schema("courses_schema.json")
+    events_schema = load_schema(SCHEMA_FILES["events"])
+    users_schema = load_schema(SCHEMA_FILES["users"])
+    courses_schema = load_schema(SCHEMA_FILES["courses"])
 
     source_filename = config["sources"]["events"]["filename"]
 
     print(f"Loaded raw events data from {source_filename}")
     print(f"Rows: {len(df_events)}, Columns: {list(df_events.columns)}")
 
-    schema_agent = SchemaValidationAgent()
-
-    schema_tables = {}
-
-    # Events
-    events_schema_result = schema_agent.run(df=df_events, schema=events_schema)
-    schema_tables["events"] = events_schema_result
+    # Schema (per table), DQ, PII and FK checks only read the raw frames, so
+    # they run side by side (see runtime.parallel_agents in the config).
+    # The agents hold no per-run state, so the process-wide coordinator's
+    # instances serve every run. (Imported here: coordinator_agent imports
+    # this module.)
+    from src.agents.coordinator_agent import get_coordinator
+
+    coordinator = get_coordinator()
+    schema_agent = coordinator.schema_agent
+    dq_agent = coordinator.dq_agent
+    pii_agent = coordinator.pii_agent
+    dq_config = config.get("data_quality", {})
+    policy_config = config.get("policy", {})
+    fk_config = config.get("schema", {}).get("foreign_keys", [])
 
-    # Users (if present)
+    tasks = {
+        "schema_events": (schema_agent.run, {"df": df_events, "schema": events_schema}),
+    }
+    # Users / courses (if present)
     if df_users is not None:
-        users_schema_result = schema_agent.run(df=df_users, schema=users_schema)
-        schema_tables["users"] = users_schema_result
-
-    # Courses (if present)
+        tasks["schema_users"] = (schema_agent.run, {"df": df_users, "schema": users_schema})
     if df_courses is not None:
-        courses_schema_result = schema_agent.run(df=df_courses, schema=courses_schema)
-        schema_tables["courses"] = courses_schema_result
+        tasks["schema_courses"] = (schema_agent.run, {"df": df_courses, "schema": courses_schema})
+    tasks["dq"] = (dq_agent.run, {"df": df_events, "dq_config": dq_config})
+    tasks["pii"] = (
+        pii_agent.run,
+        {"df": df_events, "schema": events_schema, "policy_config": policy_config},
+    )
+    tasks["fk"] = (validate_foreign_keys, {"dfs": dfs, "fk_config": fk_config})
+
+    parallel = config.get("runtime", {}).get("parallel_agents", True)
+    results = run_tasks(tasks, parallel=parallel)
 
+    schema_tables = {
+        name[len("schema_"):]: res
+        for name, res in results.items()
+        if name.startswith("schema_")
+    }
     schema_passed = all(tbl.get("passed") for tbl in schema_tables.values())
 
     schema_results = {
@@ -146,33 +460,26 @@ def main():
         "tables": schema_tables,
     }
 
-
-    # === Data quality ===
-    dq_config = config.get("data_quality", {})
-    dq_agent = DataQualityAgent()
-    dq_results = dq_agent.run(df=df_raw, dq_config=dq_config)
-
-    # === PII / policy ===
-    policy_config = config.get("policy", {})
-    pii_agent = PiiPolicyAgent()
-    pii_results = pii_agent.run(
-        df=df_raw, schema=events_schema, policy_config=policy_config
-    )
+    dq_results = results["dq"]
+    pii_results = results["pii"]
     df_curated = pii_results["df_curated"]
-
-    # === Foreign-key checks (real validation) ===
-    fk_config = config.get("schema", {}).get("foreign_keys", [])
-    fk_results = validate_foreign_keys(dfs, fk_config)
+    fk_results = results["fk"]
 
     # Save curated data
-    curated_filename = config["targets"]["events_curated"]["filename"]
-    save_events_curated(df_curated, curated_filename)
+    curated_target = config["targets"]["events_curated"]
+    curated_filename = curated_target["filename"]
+    save_events_curated(
+        df_curated,
+        curated_filename,
+        curated_target.get("format"),
+        curated_out_dir(curated_target),
+    )
 
     rows_in = len(df_events)
     rows_out = len(df_curated)
 
-    # Build + save summary
-    summary = build_run_summary(
+    # Build summary
+    return build_run_summary(
         config,
         schema_results,
         dq_results,
@@ -183,6 +490,11 @@ def main():
         rows_in,
         rows_out,
     )
+
+
+def main():
+    summary = run_pipeline_and_return_summary()
+
     def _json_default(obj):
         """Helper to make our summary JSON-serializable."""
         # DataFrames → list of dicts
@@ -2,37 +2,95 @@
 
 from __future__ import annotations
 
+import gzip
+import itertools
 import json
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Any, Dict
-import numpy as np
 
-import pandas as pd
+# numpy / pandas are imported inside the helpers that need them, so that
+# importing this module alone doesn't pay their start-up cost.
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
+try:  # optional: faster JSON codec for the saved summaries
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
+# Encoded summaries larger than this are saved gzipped (.json.gz).
+GZIP_THRESHOLD_BYTES = 16 * 1024
+
+# Example values kept per unbounded list (e.g. invalid event types) in a summary.
+MAX_SUMMARY_EXAMPLES = 5
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 RUN_SUMMARIES_DIR = PROJECT_ROOT / "data" / "run_summaries"
-RUN_SUMMARIES_DIR.mkdir(parents=True, exist_ok=True)
 
 def _remove_dataframes(d: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Return a shallow copy of d with any pandas DataFrame values removed.
+    Return d with any pandas DataFrame values removed.
 
     The pipeline agent results sometimes include full DataFrames (e.g. df_curated),
     which are not JSON-serializable. Those should not be part of the persisted
     summary; we keep only scalar / list / dict metadata.
+
+    Most results hold no DataFrame at all; those are returned as-is rather
+    than copied, so callers must not mutate the result.
     """
-    clean: Dict[str, Any] = {}
-    for k, v in d.items():
-        # drop DataFrame values at the top-level.
-        # nested DataFrames will be handled by the sanitizer below.
-        if isinstance(v, pd.DataFrame):
-            continue
-        clean[k] = v
-    return clean
+    import pandas as pd
+
+    # drop DataFrame values at the top-level.
+    # nested DataFrames will be handled by the sanitizer below.
+    if not any(isinstance(v, pd.DataFrame) for v in d.values()):
+        return d
+    return {k: v for k, v in d.items() if not isinstance(v, pd.DataFrame)}
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Residual types for the orjson path of _sanitize_for_json."""
+    import numpy as np
+    import pandas as pd
+
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, (np.ndarray, pd.Index)):
+        # object arrays / Index values; numeric arrays never get here
+        return list(obj)
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError
 
 
 def _sanitize_for_json(obj: Any) -> Any:
+    """
+    Convert ``obj`` into plain JSON-friendly builtins (see
+    _sanitize_recursive for the rules).
+
+    With orjson installed this is one C-level encode/decode round trip:
+    numpy scalars and arrays are encoded natively, NaN becomes null, and only
+    the few pandas types above go through a Python callback. Anything orjson
+    can't take falls back to the recursive walk.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(
+                orjson.dumps(
+                    obj,
+                    default=_orjson_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME,
+                )
+            )
+        except TypeError:
+            pass
+    return _sanitize_recursive(obj)
+
+
+def _sanitize_recursive(obj: Any) -> Any:
     """
     Recursively convert pandas / numpy scalars and containers into
     plain Python builtins that json.dump will accept.
@@ -43,24 +101,27 @@ def _sanitize_for_json(obj: Any) -> Any:
     - pd.NA / NaN / NaT -> None
     - dict/list/tuple/set -> converted recursively
     """
+    import numpy as np
+    import pandas as pd
 
     # simple fast-paths
     if obj is None:
         return None
 
-    # pandas/numpy NA values -> None
-    try:
-        if pd.isna(obj):
-            return None
-    except Exception:
-        # pd.isna can raise for some types (e.g. dict) - ignore
-        pass
+    # pandas/numpy NA values -> None. Only scalar types that can hold a
+    # missing value are tested, so containers never go through pd.isna.
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, float):  # includes np.float64
+        return None if obj != obj else float(obj)
+    if isinstance(obj, (np.datetime64, np.timedelta64)) and np.isnat(obj):
+        return None
 
     # numpy scalar types
     if isinstance(obj, (np.integer,)):
         return int(obj)
     if isinstance(obj, (np.floating,)):
-        return float(obj)
+        return None if np.isnan(obj) else float(obj)
     if isinstance(obj, (np.bool_,)):
         return bool(obj)
 
@@ -70,19 +131,24 @@ def _sanitize_for_json(obj: Any) -> Any:
 
     # containers
     if isinstance(obj, dict):
-        return {str(k): _sanitize_for_json(v) for k, v in obj.items()}
+        return {str(k): _sanitize_recursive(v) for k, v in obj.items()}
 
     if isinstance(obj, (list, tuple, set)):
-        return [_sanitize_for_json(x) for x in obj]
+        return [_sanitize_recursive(x) for x in obj]
 
     # numpy arrays / pandas Index
     if isinstance(obj, (np.ndarray, pd.Index)):
-        return [_sanitize_for_json(x) for x in list(obj)]
+        return [_sanitize_recursive(x) for x in list(obj)]
 
     # default: leave as-is (json.dumps will raise if unhandled)
     return obj
 
 
+def check_passed_flags(checks: Dict[str, Any]) -> Dict[str, bool]:
+    """Map each check name ("schema", "data_quality", ...) to its passed flag."""
+    return {name: bool(result.get("passed")) for name, result in checks.items()}
+
+
 def build_run_summary(
     config: Dict[str, Any],
     schema_results: Dict[str, Any],
@@ -93,6 +159,7 @@ def build_run_summary(
     curated_filename: str,
     rows_in: int,
     rows_out: int,
+    generated_at: float | None = None,
 ) -> Dict[str, Any]:
     """
     Construct a normalized summary dictionary for a single governance pipeline run.
@@ -101,24 +168,43 @@ def build_run_summary(
       - CoordinatorAgent
       - Markdown report generation
       - Any external reporting / dashboards
+
+    generated_at is the run's epoch timestamp (time.time()); defaults to now.
     """
 
     # Strip out any DataFrames from the result dicts before persisting
-    schema_results_clean = _remove_dataframes(schema_results)
-    dq_results_clean = _remove_dataframes(dq_results)
-    pii_results_clean = _remove_dataframes(pii_results)
-    fk_results_clean = _remove_dataframes(fk_results)
+    results = {
+        "schema": _remove_dataframes(schema_results),
+        "data_quality": _remove_dataframes(dq_results),
+        "pii_policy": _remove_dataframes(pii_results),
+        "foreign_keys": _remove_dataframes(fk_results),
+    }
+
+    # Normalize boolean flags for each check; default to False if missing.
+    # Each check gets a new dict with the flag already in place, so the
+    # agents' own result dicts are never modified.
+    passed_flags = check_passed_flags(results)
+    checks = {
+        name: {**result, "passed": passed_flags[name]}
+        for name, result in results.items()
+    }
+
+    # A badly broken input can yield thousands of invalid event types; keep a
+    # few examples plus the total so the saved summary and report stay small.
+    dq_checks = checks["data_quality"]
+    invalid_event_types = dq_checks.get("invalid_event_types")
+    if invalid_event_types:
+        dq_checks["invalid_event_types"] = list(
+            itertools.islice(invalid_event_types, MAX_SUMMARY_EXAMPLES)
+        )
+        dq_checks["invalid_event_types_total"] = len(invalid_event_types)
 
     summary: Dict[str, Any] = {
         "run_id": config.get("run_id"),
         "description": config.get("description", ""),
-        "overall_passed": None,  # set below
-        "checks": {
-            "schema": schema_results_clean,
-            "data_quality": dq_results_clean,
-            "pii_policy": pii_results_clean,
-            "foreign_keys": fk_results_clean,
-        },
+        # Overall run passes only if all individual checks pass
+        "overall_passed": all(passed_flags.values()),
+        "checks": checks,
         "lineage": {
             "source": {
                 "filename": source_filename,
@@ -130,50 +216,150 @@ def build_run_summary(
             },
         },
         "metadata": {
-            "generated_at_utc": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "generated_at_utc": _utc_iso(generated_at),
         },
     }
 
-    # Normalize boolean flags for each check; default to False if missing
-    schema_passed = bool(schema_results_clean.get("passed"))
-    dq_passed = bool(dq_results_clean.get("passed"))
-    pii_passed = bool(pii_results_clean.get("passed"))
-    fk_passed = bool(fk_results_clean.get("passed"))
-
-    summary["checks"]["schema"]["passed"] = schema_passed
-    summary["checks"]["data_quality"]["passed"] = dq_passed
-    summary["checks"]["pii_policy"]["passed"] = pii_passed
-    summary["checks"]["foreign_keys"]["passed"] = fk_passed
-
-    # Overall run passes only if all individual checks pass
-    summary["overall_passed"] = schema_passed and dq_passed and pii_passed and fk_passed
-
     # Make sure the summary contains only JSON-friendly values before returning
     sanitized = _sanitize_for_json(summary)
     return sanitized
 
 
-def save_run_summary(summary: dict, timestamp: str | None = None) -> tuple[Path, str]:
+def _utc_iso(ts: float | None = None) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+def restamp_summary(
+    summary: Dict[str, Any], generated_at: float | None = None
+) -> Dict[str, Any]:
+    """
+    Copy of a (reused) run summary whose metadata.generated_at_utc is
+    generated_at (defaults to now), so a report saved from it isn't dated
+    by the earlier run. The rest of the summary is shared, not copied.
+    """
+    metadata = {
+        **summary.get("metadata", {}),
+        "generated_at_utc": _utc_iso(generated_at),
+    }
+    return {**summary, "metadata": metadata}
+
+
+def run_timestamp(ts: float | None = None) -> str:
+    """UTC file timestamp (YYYYmmdd_HHMMSS) for epoch ts; defaults to now."""
+    return time.strftime("%Y%m%d_%H%M%S", time.gmtime(ts))
+
+
+def save_run_summary(
+    summary: dict, timestamp: str | None = None, pretty: bool = False
+) -> tuple[Path, str]:
     """
     Save a JSON summary to data/run_summaries/run_summary_<timestamp>.json.
 
+    The JSON is compact unless pretty=True (2-space indent, for files meant
+    to be read by hand). Summaries over GZIP_THRESHOLD_BYTES once encoded
+    are written gzipped, as run_summary_<timestamp>.json.gz, instead.
+
     Returns (summary_path, timestamp).
     """
     if timestamp is None:
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = run_timestamp()
 
+    RUN_SUMMARIES_DIR.mkdir(parents=True, exist_ok=True)
     summary_path = RUN_SUMMARIES_DIR / f"run_summary_{timestamp}.json"
 
     def default(o):
         # Make everything JSON-serializable
         return str(o)
 
-    with summary_path.open("w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, default=default)
+    payload = _orjson_payload(summary, pretty, default)
+    if payload is None:
+        # stdlib encoder: streamed to the file rather than built in memory.
+        return _write_stdlib_json(summary, summary_path, pretty, default), timestamp
+
+    if len(payload) > GZIP_THRESHOLD_BYTES:
+        # Level 1: most of the size win on repetitive JSON for very little
+        # CPU.
+        summary_path = summary_path.with_suffix(".json.gz")
+        with gzip.open(summary_path, "wb", compresslevel=1) as f:
+            f.write(payload)
+    else:
+        summary_path.write_bytes(payload)
 
     return summary_path, timestamp
 
 
+def _orjson_payload(summary: dict, pretty: bool, default) -> bytes | None:
+    """
+    The summary encoded by orjson, or None when orjson is unavailable or
+    rejects the summary (the caller then uses the stdlib encoder).
+    """
+    if orjson is None:
+        return None
+    # orjson encodes straight to UTF-8 bytes (and handles numpy
+    # scalars/arrays natively).
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(summary, default=default, option=option)
+    except TypeError:
+        # orjson rejects a few things json accepts (e.g. ints beyond
+        # 64 bits).
+        return None
+
+
+# Bytes of encoded JSON gathered before each write.
+_WRITE_CHUNK_BYTES = 65536
+
+
+def _write_stdlib_json(
+    summary: dict, summary_path: Path, pretty: bool, default
+) -> Path:
+    """
+    Stream the stdlib encoder's chunks to summary_path in 64 KiB writes,
+    without holding the whole encoded text in memory. Only the first
+    GZIP_THRESHOLD_BYTES are held back; past that the file is written
+    gzipped (.json.gz) instead, as for orjson. Returns the written path.
+    """
+    if pretty:
+        encoder = json.JSONEncoder(indent=2, default=default)
+    else:
+        encoder = json.JSONEncoder(separators=(",", ":"), default=default)
+    chunks = (chunk.encode("utf-8") for chunk in encoder.iterencode(summary))
+
+    head = []
+    size = 0
+    for data in chunks:
+        head.append(data)
+        size += len(data)
+        if size > GZIP_THRESHOLD_BYTES:
+            gz_path = summary_path.with_suffix(".json.gz")
+            with gzip.open(gz_path, "wb", compresslevel=1) as f:
+                f.write(b"".join(head))
+                for batch in _batched_bytes(chunks, _WRITE_CHUNK_BYTES):
+                    f.write(batch)
+            return gz_path
+
+    with summary_path.open("wb", buffering=_WRITE_CHUNK_BYTES) as f:
+        f.writelines(head)
+    return summary_path
+
+
+def _batched_bytes(chunks, size: int):
+    """Join small byte chunks into pieces of about ``size`` bytes."""
+    batch = []
+    pending = 0
+    for data in chunks:
+        batch.append(data)
+        pending += len(data)
+        if pending >= size:
+            yield b"".join(batch)
+            batch = []
+            pending = 0
+    if batch:
+        yield b"".join(batch)
+
+
 class RunSummaryAgent:
     """
     Thin wrapper around build_run_summary + save_run_summary so the coordinator
@@ -192,6 +378,8 @@ class RunSummaryAgent:
         rows_in: int,
         rows_out: int,
     ) -> Dict[str, Any]:
+        # One clock read names the saved file and stamps the summary.
+        ts = time.time()
         summary = build_run_summary(
             config=config,
             schema_results=schema_results,
@@ -202,34 +390,38 @@ class RunSummaryAgent:
             curated_filename=curated_filename,
             rows_in=rows_in,
             rows_out=rows_out,
+            generated_at=ts,
         )
 
-        summary_path = save_run_summary(summary)
+        summary_path = save_run_summary(summary, timestamp=run_timestamp(ts))
         return {
             "summary": summary,
             "summary_path": summary_path,
+            "passed_flags": check_passed_flags(summary["checks"]),
         }
 
 def print_run_summary(summary: Dict[str, Any]) -> None:
-    print("\n=== Governance Run Summary ===")
+    lines = ["\n=== Governance Run Summary ==="]
 
     checks = summary.get("checks", {})
 
     # Schema (with per-table breakdown)
     schema = checks.get("schema", {})
     schema_status = "PASSED" if schema.get("passed") else "FAILED"
-    print(f"- schema: {schema_status}")
+    lines.append(f"- schema: {schema_status}")
     tables = schema.get("tables") or {}
     for table_name, table_result in tables.items():
         t_status = "PASSED" if table_result.get("passed") else "FAILED"
-        print(f"    - {table_name}: {t_status}")
+        lines.append(f"    - {table_name}: {t_status}")
 
     # Other checks
     for name in ("data_quality", "pii_policy", "foreign_keys"):
         result = checks.get(name, {})
         status = "PASSED" if result.get("passed") else "FAILED"
-        print(f"- {name}: {status}")
+        lines.append(f"- {name}: {status}")
 
     overall = summary.get("overall_passed")
-    print(f"\nOverall passed: {overall}")
+    lines.append(f"\nOverall passed: {overall}")
 
+    # One write for the whole block instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
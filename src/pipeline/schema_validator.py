@@ -9,42 +9,79 @@ This module performs:
 - Type validation (basic, string vs numeric)
 """
 
-from typing import Dict, Any, List
+import functools
+import json
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Tuple
 import pandas as pd
 
 
+class _CompiledSchema(NamedTuple):
+    columns: FrozenSet[str]                     # every declared column
+    required: Tuple[str, ...]                   # required columns, schema order
+    allowed_values: Tuple[Tuple[str, pd.Index], ...]  # (column, allowed values)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_schema(schema_json: str) -> _CompiledSchema:
+    schema = json.loads(schema_json)
+    columns = schema["columns"]
+    return _CompiledSchema(
+        columns=frozenset(col["name"] for col in columns),
+        required=tuple(col["name"] for col in columns if col.get("required", False)),
+        # Built once per schema: an Index keeps its hash table after the
+        # first lookup, so later validations reuse it.
+        allowed_values=tuple(
+            (col["name"], pd.Index(list(dict.fromkeys(col["allowed_values"]))))
+            for col in columns
+            if "allowed_values" in col
+        ),
+    )
+
+
+def _compiled(schema: Dict[str, Any]) -> _CompiledSchema:
+    """
+    Reduce a schema dict to the lookups validate_schema needs. Cached on the
+    schema's canonical JSON, so validating several tables per run (and every
+    tool call after that) reuses the same compiled object.
+    """
+    return _compile_schema(json.dumps(schema, sort_keys=True))
+
+
 def validate_schema(df: pd.DataFrame, schema: Dict[str, Any]) -> Dict[str, Any]:
     results = {
         "missing_columns": [],
         "extra_columns": [],
-        "invalid_values": {},      # column -> list of invalid values
+        "invalid_values": {},      # column -> invalid values, first-seen order
         "type_mismatches": {},     # column -> count or details
         "passed": True
     }
 
-    # Extract fields defined in the schema
-    schema_columns = {col["name"]: col for col in schema["columns"]}
-    required_columns = [col["name"] for col in schema["columns"] if col.get("required", False)]
+    compiled = _compiled(schema)
+    # Membership tests below run against a plain set rather than the Index.
+    df_columns = set(df.columns)
 
     # ---- Check missing required columns ----
-    for col in required_columns:
-        if col not in df.columns:
+    for col in compiled.required:
+        if col not in df_columns:
             results["missing_columns"].append(col)
             results["passed"] = False
 
     # ---- Check extra columns in raw data ----
     for col in df.columns:
-        if col not in schema_columns:
+        if col not in compiled.columns:
             results["extra_columns"].append(col)
             results["passed"] = False
 
     # ---- Check values against allowed_values ----
-    for col_name, col_spec in schema_columns.items():
-        if "allowed_values" in col_spec and col_name in df.columns:
-            allowed = col_spec["allowed_values"]
-            invalid = sorted(set(df[col_name].dropna()) - set(allowed))
-            if invalid:
-                results["invalid_values"][col_name] = invalid
+    for col_name, allowed in compiled.allowed_values:
+        if col_name in df_columns:
+            # Enumerated columns have few distinct values: test those
+            # instead of every row. -1 marks a value outside the allowed set.
+            distinct = df[col_name].unique()
+            invalid_mask = (allowed.get_indexer(distinct) == -1) & ~pd.isna(distinct)
+            if invalid_mask.any():
+                # Left unsorted here; the printers sort them for display.
+                results["invalid_values"][col_name] = distinct[invalid_mask].tolist()
                 results["passed"] = False
 
     # ---- Basic type checking (optional for now) ----
@@ -75,4 +112,4 @@ def print_schema_validation_results(results: Dict[str, Any]) -> None:
     if results["invalid_values"]:
         print("\nColumns with invalid values:")
         for col, vals in results["invalid_values"].items():
-            print(f"  - {col}: {vals}")
+            print(f"  - {col}: {sorted(vals)}")
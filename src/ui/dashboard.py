@@ -1,8 +1,20 @@
+import functools
+import gzip
+import heapq
 import json
+import os
+import re
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import streamlit as st
+import yaml
+
+try:  # optional: faster JSON parsing for run summaries
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
 
 # -------------------------------------------------------------------
 # Paths – adjust these if your project layout is different
@@ -13,33 +25,120 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 REPORTS_DIR = PROJECT_ROOT / "reports"
 SUMMARIES_DIR = PROJECT_ROOT / "data" / "run_summaries"
 
+# Configurations offered in the dashboard: label -> (filename, description)
+CONFIG_OPTIONS: dict[str, tuple[str, str]] = {
+    "Success (pipeline_config_success.yaml)": (
+        "pipeline_config_success.yaml",
+        "A small sample configuration that uses 'good' sample files and should pass all checks.",
+    ),
+    "Issues (pipeline_config_issues.yaml)": (
+        "pipeline_config.yaml",
+        "A config pointing to richer test fixtures designed to surface schema, DQ, and FK issues.",
+    ),
+}
+
+# Most recent reports offered in the selectbox; "Show older reports" adds
+# another page of this size.
+REPORT_LIST_LIMIT = 50
+
 # Import the tool that runs the pipeline + generates a markdown report
 from src.agents.run_summary_agent import generate_markdown_report  # type: ignore
-from src.pipeline.run_pipeline import load_config
+from src.pipeline.run_pipeline import CONFIG_DIR, load_config
 
 
 # -------------------------------------------------------------------
 # Helpers for reports + summaries
 # -------------------------------------------------------------------
-def list_markdown_reports():
-    """Return a list of (label, path) for governance_report_*.md files."""
+def list_markdown_reports(limit: int | None = None):
+    """
+    Return a list of (label, path) for governance_report_*.md files, most
+    recent first; only the `limit` most recent ones if a limit is given.
+    """
     if not REPORTS_DIR.exists():
         return []
 
-    files = sorted(
-        REPORTS_DIR.glob("governance_report_*.md"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    # One stat per report: the mtime collected here is used both for
+    # sorting and for the label.
+    with os.scandir(REPORTS_DIR) as it:
+        files = [
+            (entry.stat().st_mtime, Path(entry.path))
+            for entry in it
+            if entry.name.startswith("governance_report_")
+            and entry.name.endswith(".md")
+            and entry.is_file()
+        ]
+    if limit is None:
+        files.sort(key=itemgetter(0), reverse=True)
+    else:
+        # Only the top `limit` are ordered (and labelled below).
+        files = heapq.nlargest(limit, files, key=itemgetter(0))
 
     items = []
-    for p in files:
-        mtime = datetime.fromtimestamp(p.stat().st_mtime)
+    for st_mtime, p in files:
+        mtime = datetime.fromtimestamp(st_mtime)
         label = f"{p.name} (modified: {mtime:%Y-%m-%d %H:%M:%S})"
         items.append((label, p))
     return items
 
 
+@st.cache_data(show_spinner=False, max_entries=4, ttl=5)
+def _scan_reports(
+    reports_dir: str, dir_mtime_ns: int, limit: int | None
+) -> list[tuple[str, str]]:
+    """list_markdown_reports() for one version (mtime) of a reports directory."""
+    return [(label, str(p)) for label, p in list_markdown_reports(limit)]
+
+
+def cached_markdown_reports(limit: int | None = None):
+    """
+    list_markdown_reports(), re-scanned only when REPORTS_DIR changes.
+
+    Streamlit reruns the whole script on every widget interaction; the
+    listing is cached on the directory's mtime, which moves whenever a
+    report is added or removed. The short ttl picks up a report that was
+    rewritten in place, which leaves the directory mtime alone.
+    """
+    try:
+        dir_mtime_ns = REPORTS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return [
+        (label, Path(p))
+        for label, p in _scan_reports(str(REPORTS_DIR), dir_mtime_ns, limit)
+    ]
+
+
+def show_older_reports() -> None:
+    """Button callback: list another page of reports on the next rerun."""
+    st.session_state.report_limit += REPORT_LIST_LIMIT
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _load_report_text(path_str: str, mtime_ns: int) -> str:
+    """Report text for one version (mtime) of the file, read in one go."""
+    with open(path_str, "rb", buffering=65536) as f:
+        return f.read().decode("utf-8")
+
+
+def load_report_text(report_path: Path) -> str:
+    """Markdown text of a report, re-read only when the file changes."""
+    return _load_report_text(str(report_path), report_path.stat().st_mtime_ns)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _config_yaml(filename: str, mtime_ns: int) -> str:
+    """YAML dump of one version (mtime) of a config file, for the preview."""
+    return yaml.safe_dump(load_config(filename=filename), sort_keys=False)
+
+
+def preview_config_yaml(filename: str) -> str:
+    """Config preview text, re-rendered only when the file changes."""
+    return _config_yaml(filename, (CONFIG_DIR / filename).stat().st_mtime_ns)
+
+
+_REPORT_NAME_RE = re.compile(r"governance_report_(.+)\.md")
+
+
 def extract_timestamp_from_report_name(report_path: Path) -> str | None:
     """
     governance_report_20251126_205040.md → 20251126_205040
@@ -49,44 +148,110 @@ def extract_timestamp_from_report_name(report_path: Path) -> str | None:
     where {timestamp} matches the summary file:
       run_summary_{timestamp}.json
     """
-    stem = report_path.stem  # governance_report_20251126_205040
-    prefix = "governance_report_"
-    if stem.startswith(prefix):
-        return stem[len(prefix) :]
+    m = _REPORT_NAME_RE.fullmatch(report_path.name)
+    return m.group(1) if m else None
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_summary_cached(path_str: str, mtime_ns: int) -> dict | None:
+    """Parsed summary for one version (mtime) of a summary file."""
+    try:
+        if path_str.endswith(".gz"):
+            with gzip.open(path_str, "rb") as f:
+                data = f.read()
+        else:
+            with open(path_str, "rb") as f:
+                data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _summary_paths_for(ts: str) -> tuple[Path, Path]:
+    """Candidate summary files (.json, then .json.gz) for a report timestamp."""
+    summary_path = SUMMARIES_DIR / f"run_summary_{ts}.json"
+    return summary_path, summary_path.with_suffix(".json.gz")
+
+
+def _find_summary_file(report_path: Path) -> tuple[str, int] | None:
+    """(path, mtime_ns) of the run_summary_*.json (or .json.gz) for a report."""
+    ts = extract_timestamp_from_report_name(report_path)
+    if ts is None:
+        return None
+
+    # Large summaries are saved gzipped
+    for path in _summary_paths_for(ts):
+        try:
+            return str(path), path.stat().st_mtime_ns
+        except OSError:
+            continue
     return None
 
 
 def load_summary_for_report(report_path: Path) -> dict | None:
     """
-    Try to find the corresponding run_summary_*.json for this report.
+    Try to find the corresponding run_summary_*.json (or .json.gz) for this report.
 
     If not found or not JSON, returns None.
     """
-    ts = extract_timestamp_from_report_name(report_path)
-    if ts is None:
-        return None
+    found = _find_summary_file(report_path)
+    return _load_summary_cached(*found) if found else None
 
-    summary_path = SUMMARIES_DIR / f"run_summary_{ts}.json"
-    if not summary_path.exists():
-        return None
 
-    try:
-        with summary_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
+def flatten_summary(d: dict, prefix: str = "", out: dict | None = None) -> dict:
+    """
+    Flatten nested dicts to dotted keys:
+    {"lineage": {"source": {"filename": f}}} → {"lineage.source.filename": f}
+    """
+    if out is None:
+        out = {}
+    for key, value in d.items():
+        if isinstance(value, dict):
+            flatten_summary(value, f"{prefix}{key}.", out)
+        else:
+            out[f"{prefix}{key}"] = value
+    return out
+
+
+# The summary fields the report view displays.
+SUMMARY_VIEW_FIELDS = (
+    "overall_passed",
+    "checks.schema.passed",
+    "checks.data_quality.passed",
+    "checks.pii_policy.passed",
+    "checks.foreign_keys.passed",
+    "metadata.run_id",
+    "metadata.generated_at_utc",
+    "metadata.description",
+    "lineage.source.filename",
+    "lineage.source.rows_in",
+    "lineage.target.filename",
+    "lineage.target.rows_out",
+)
 
 
-def get_safe(d: dict, path: list[str], default="unknown"):
-    """Safe nested dict getter: get_safe(summary, ['lineage','source','filename'])."""
-    cur = d
-    for key in path:
-        if not isinstance(cur, dict) or key not in cur:
-            return default
-        cur = cur[key]
-    return cur
+@st.cache_data(show_spinner=False, max_entries=64)
+def _flat_summary_cached(path_str: str, mtime_ns: int) -> dict:
+    flat = flatten_summary(_load_summary_cached(path_str, mtime_ns) or {})
+    # Keep only what the view reads: cache hits are copied out of the
+    # cache, so the per-check details would be re-copied on every rerun.
+    return {key: flat[key] for key in SUMMARY_VIEW_FIELDS if key in flat}
 
 
+def load_flat_summary_for_report(report_path: Path) -> dict:
+    """
+    The SUMMARY_VIEW_FIELDS of the report's summary, flattened by
+    flatten_summary() so the view can read each field with one dict lookup.
+    Empty if there is no summary.
+    """
+    found = _find_summary_file(report_path)
+    return _flat_summary_cached(*found) if found else {}
+
+
+@functools.lru_cache(maxsize=16)
 def render_status_chip(label: str, passed: bool) -> str:
     """Return HTML for a small colored status chip."""
     bg = "#e8f5e9" if passed else "#ffebee"
@@ -130,35 +295,22 @@ The pipeline:
 """
 )
 
-left_col, right_col = st.columns([1, 1])
+# Pipeline controls keep to the left half, above the report browser.
+left_col, _ = st.columns([1, 1])
 
 # -------------------------------------------------------------------
-# Left column: Run pipeline + report picker
+# Left column: Run pipeline
 # -------------------------------------------------------------------
 with left_col:
     st.subheader("Run Governance Pipeline")
 
     st.caption("Choose a configuration to run")
 
-    # Option format: (label, filename, description)
-    config_options = [
-        (
-            "Success (pipeline_config_success.yaml)",
-            "pipeline_config_success.yaml",
-            "A small sample configuration that uses 'good' sample files and should pass all checks.",
-        ),
-        (
-            "Issues (pipeline_config_issues.yaml)",
-            "pipeline_config.yaml",
-            "A config pointing to richer test fixtures designed to surface schema, DQ, and FK issues.",
-        ),
-    ]
-
-    config_labels = [c[0] for c in config_options]
+    config_labels = list(CONFIG_OPTIONS)
     # Selectbox returns the chosen label. This avoids storing an index value in
     # session_state that could be mutated to a non-int and cause errors.
     # Ensure any persisted session_state value is valid for this set of labels
-    if "config_choice_label" in st.session_state and st.session_state.config_choice_label not in config_labels:
+    if "config_choice_label" in st.session_state and st.session_state.config_choice_label not in CONFIG_OPTIONS:
         st.session_state.config_choice_label = config_labels[0]
 
     selected_label = st.selectbox(
@@ -168,18 +320,13 @@ with left_col:
         key="config_choice_label",
     )
 
-    config_choice_index = config_labels.index(selected_label)
-    selected_config_filename = config_options[config_choice_index][1]
-    selected_config_description = config_options[config_choice_index][2]
+    selected_config_filename, selected_config_description = CONFIG_OPTIONS[selected_label]
 
     # show a small description and a preview expander so the user can inspect the YAML
     st.markdown(f"**Description:** {selected_config_description}")
     with st.expander("Preview config YAML"):
         try:
-            cfg = load_config(filename=selected_config_filename)
-            import yaml as _yaml
-
-            st.code(_yaml.safe_dump(cfg, sort_keys=False), language="yaml")
+            st.code(preview_config_yaml(selected_config_filename), language="yaml")
         except Exception as e:
             st.warning(f"Could not load preview for {selected_config_filename}: {e}")
 
@@ -201,154 +348,179 @@ with left_col:
             st.info(f"New report generated: `{report_path}`")
 
             # Re-populate the reports listing and optionally auto-select the new report
-            reports = list_markdown_reports()
+            reports = cached_markdown_reports(limit=st.session_state.get("report_limit", REPORT_LIST_LIMIT))
             # find the matching label for the generated report file and set session state
             if st.session_state.get("auto_select_new_report", False):
-                matching = [label for label, p in reports if p.name == Path(report_path).name]
-                if matching:
+                name_to_label = {p.name: label for label, p in reports}
+                matching_label = name_to_label.get(Path(report_path).name)
+                if matching_label is not None:
                     # programmatically set the selectbox value so the right report is displayed
-                    st.session_state["report_select"] = matching[0]
+                    st.session_state["report_select"] = matching_label
 
         if overall:
             st.success("Overall status: PASSED ✅")
         else:
             st.error("Overall status: FAILED ❌")
 
-    st.markdown("---")
-    st.subheader("Available Reports")
 
-    reports = list_markdown_reports()
-    if not reports:
-        st.write("No reports found yet. Run the pipeline to generate one.")
-        selected_report_path = None
-    else:
-        labels = [label for label, _ in reports]
-        default_index = 0  # most recent first
-        # remember selection in session_state so the auto-select feature can
-        # programmatically change which report is displayed
-        if "report_select" not in st.session_state:
-            st.session_state.report_select = labels[default_index]
-        # If the session contains a stale report_select value not present in
-        # the current labels list (e.g. reports rotated/removed), reset to
-        # the default most-recent label.
-        if st.session_state.report_select not in labels:
-            st.session_state.report_select = labels[default_index]
-
-        selected_label = st.selectbox(
-            "Select a report to view:",
-            options=labels,
-            key="report_select",
-        )
-        selected_report_path = dict(reports)[selected_label]
-
-        # "Clickable" / downloadable actions for the report file
-        with st.expander("Report file actions"):
-            st.markdown(
-                f"[Open raw markdown file]({selected_report_path.as_uri()})  \n"
-                f"`{selected_report_path}`",
-                unsafe_allow_html=True,
+# -------------------------------------------------------------------
+# Report browser: picker (left) + governance report viewer (right)
+# -------------------------------------------------------------------
+@st.fragment
+def render_report_browser() -> None:
+    """
+    Report picker and viewer. As a fragment, choosing another report (or
+    paging through older ones) reruns only this function, not the
+    pipeline controls above it.
+    """
+    picker_col, viewer_col = st.columns([1, 1])
+
+    with picker_col:
+        st.subheader("Available Reports")
+
+        if "report_limit" not in st.session_state:
+            st.session_state.report_limit = REPORT_LIST_LIMIT
+        reports = cached_markdown_reports(limit=st.session_state.report_limit)
+        if not reports:
+            st.write("No reports found yet. Run the pipeline to generate one.")
+            selected_report_path = None
+        else:
+            label_to_path = dict(reports)
+            labels = list(label_to_path)
+            default_index = 0  # most recent first
+            # remember selection in session_state so the auto-select feature can
+            # programmatically change which report is displayed
+            if "report_select" not in st.session_state:
+                st.session_state.report_select = labels[default_index]
+            # If the session contains a stale report_select value not present in
+            # the current labels list (e.g. reports rotated/removed), reset to
+            # the default most-recent label.
+            if st.session_state.report_select not in label_to_path:
+                st.session_state.report_select = labels[default_index]
+
+            selected_label = st.selectbox(
+                "Select a report to view:",
+                options=labels,
+                key="report_select",
             )
+            selected_report_path = label_to_path[selected_label]
+
+            # A full page means there may be older reports beyond the limit.
+            if len(reports) >= st.session_state.report_limit:
+                st.button("Show older reports", on_click=show_older_reports)
+
+            # Read once per rerun: the download button and the inline viewer
+            # below share the same text.
             try:
-                text = selected_report_path.read_text(encoding="utf-8")
-                st.download_button(
-                    "⬇️ Download markdown",
-                    data=text,
-                    file_name=selected_report_path.name,
-                    mime="text/markdown",
-                )
+                report_text, report_error = load_report_text(selected_report_path), None
             except Exception as e:
-                st.warning(f"Could not read report: {e}")
+                report_text, report_error = None, e
+
+            # "Clickable" / downloadable actions for the report file
+            with st.expander("Report file actions"):
+                st.markdown(
+                    f"[Open raw markdown file]({selected_report_path.as_uri()})  \n"
+                    f"`{selected_report_path}`",
+                    unsafe_allow_html=True,
+                )
+                if report_error is None:
+                    st.download_button(
+                        "⬇️ Download markdown",
+                        data=report_text,
+                        file_name=selected_report_path.name,
+                        mime="text/markdown",
+                    )
+                else:
+                    st.warning(f"Could not read report: {report_error}")
+
+        st.caption(f"Reports directory: `{REPORTS_DIR}`")
+
+    with viewer_col:
+        st.subheader("Governance Report")
+
+        if not selected_report_path:
+            st.write("Select a report on the left to view details.")
+        else:
+            st.write(
+                "Viewing:",
+                f"`{selected_report_path.name}`",
+            )
 
-    st.caption(f"Reports directory: `{REPORTS_DIR}`")
+            # Load matching summary JSON (if available)
+            summary = load_flat_summary_for_report(selected_report_path)
+
+            # ---- Overall status ----
+            overall_passed = bool(summary.get("overall_passed", False))
+            if overall_passed:
+                st.markdown("**Overall Status:** ✅ PASSED")
+            else:
+                st.markdown("**Overall Status:** ❌ FAILED")
+
+            # ---- Status chips by category ----
+            schema_passed = bool(summary.get("checks.schema.passed", False))
+            dq_passed = bool(summary.get("checks.data_quality.passed", False))
+            pii_passed = bool(summary.get("checks.pii_policy.passed", False))
+            fk_passed = bool(summary.get("checks.foreign_keys.passed", False))
+
+            chips_html = "".join((
+                render_status_chip("Schema", schema_passed),
+                render_status_chip("Data Quality", dq_passed),
+                render_status_chip("PII Policy", pii_passed),
+                render_status_chip("Foreign Keys", fk_passed),
+            ))
+
+            st.markdown("#### Check Status")
+            st.markdown(chips_html, unsafe_allow_html=True)
+            st.caption(
+                "Each chip shows whether that governance dimension passed on this run."
+            )
 
-# -------------------------------------------------------------------
-# Right column: Governance report + dynamic metadata + chips
-# -------------------------------------------------------------------
-with right_col:
-    st.subheader("Governance Report")
+            # ---- High-level metadata ----
+            run_id = summary.get("metadata.run_id", "N/A")
+            generated_at = summary.get("metadata.generated_at_utc", "N/A")
+            description = summary.get("metadata.description", "N/A")
 
-    if not selected_report_path:
-        st.write("Select a report on the left to view details.")
-    else:
-        st.write(
-            "Viewing:",
-            f"`{selected_report_path.name}`",
-        )
-
-        # Load matching summary JSON (if available)
-        summary = load_summary_for_report(selected_report_path) or {}
-
-        # ---- Overall status ----
-        overall_passed = bool(summary.get("overall_passed", False))
-        if overall_passed:
-            st.markdown("**Overall Status:** ✅ PASSED")
-        else:
-            st.markdown("**Overall Status:** ❌ FAILED")
-
-        # ---- Status chips by category ----
-        checks = summary.get("checks", {})
-
-        schema_passed = bool(get_safe(checks, ["schema", "passed"], default=False))
-        dq_passed = bool(get_safe(checks, ["data_quality", "passed"], default=False))
-        pii_passed = bool(get_safe(checks, ["pii_policy", "passed"], default=False))
-        fk_passed = bool(get_safe(checks, ["foreign_keys", "passed"], default=False))
-
-        chips_html = (
-            render_status_chip("Schema", schema_passed)
-            + render_status_chip("Data Quality", dq_passed)
-            + render_status_chip("PII Policy", pii_passed)
-            + render_status_chip("Foreign Keys", fk_passed)
-        )
-
-        st.markdown("#### Check Status")
-        st.markdown(chips_html, unsafe_allow_html=True)
-        st.caption(
-            "Each chip shows whether that governance dimension passed on this run."
-        )
-
-        # ---- High-level metadata ----
-        run_id = get_safe(summary, ["metadata", "run_id"], default="N/A")
-        generated_at = get_safe(summary, ["metadata", "generated_at_utc"], default="N/A")
-        description = get_safe(summary, ["metadata", "description"], default="N/A")
-
-        st.markdown(
-            f"""
+            st.markdown(
+                f"""
 **Run ID:** `{run_id}`  
 **Generated at (UTC):** `{generated_at}`  
 **Description:** {description}
 """
-        )
+            )
 
-        st.markdown("---")
-        st.markdown("### Dataset Lineage")
+            st.markdown("---")
+            st.markdown("### Dataset Lineage")
 
-        source_file = get_safe(summary, ["lineage", "source", "filename"])
-        rows_in = get_safe(summary, ["lineage", "source", "rows_in"])
-        target_file = get_safe(summary, ["lineage", "target", "filename"])
-        rows_out = get_safe(summary, ["lineage", "target", "rows_out"])
+            source_file = summary.get("lineage.source.filename", "unknown")
+            rows_in = summary.get("lineage.source.rows_in", "unknown")
+            target_file = summary.get("lineage.target.filename", "unknown")
+            rows_out = summary.get("lineage.target.rows_out", "unknown")
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(
-                f"""
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(
+                    f"""
 **Source file:** `{source_file}`  
 **Rows in (raw):** `{rows_in}`
 """
-            )
-        with col2:
-            st.markdown(
-                f"""
+                )
+            with col2:
+                st.markdown(
+                    f"""
 **Target file:** `{target_file}`  
 **Rows out (curated):** `{rows_out}`
 """
-            )
+                )
 
-        st.markdown("---")
-        st.markdown("### Full Markdown Report")
+            st.markdown("---")
+            st.markdown("### Full Markdown Report")
 
-        # Render the markdown content inline
-        try:
-            markdown_text = selected_report_path.read_text(encoding="utf-8")
-            st.markdown(markdown_text)
-        except Exception as e:
-            st.error(f"Error reading report markdown: {e}")
+            # Render the markdown content inline
+            if report_error is None:
+                st.markdown(report_text)
+            else:
+                st.error(f"Error reading report markdown: {report_error}")
+
+
+st.markdown("---")
+render_report_browser()
@@ -2,6 +2,9 @@
 import sys
 import pathlib
 
+import pandas as pd
+import pytest
+
 # Project root (the folder that contains src/, tests/, etc.)
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 
@@ -9,3 +12,29 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 root_str = str(ROOT)
 if root_str not in sys.path:
     sys.path.insert(0, root_str)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def csv_cache_dir(tmp_path_factory):
+    """Keep the raw-CSV Parquet cache out of the repo's data/cache/."""
+    import src.pipeline.run_pipeline as rp
+
+    cache_dir = tmp_path_factory.mktemp("csv_cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(rp, "CSV_CACHE_DIR", cache_dir)
+        yield cache_dir
+
+
+# Shared inputs for the foreign-key tests. validate_foreign_keys never
+# modifies its inputs, so one frame per module is enough.
+@pytest.fixture(scope="module")
+def df_events_fk():
+    # events reference user_id 1, 2 and 3
+    return pd.DataFrame({"event_id": [1, 2, 3], "user_id": [1, 2, 3]})
+
+
+@pytest.fixture(scope="module")
+def fk_config_user():
+    return [
+        {"table": "events", "column": "user_id", "ref_table": "users", "ref_column": "user_id"}
+    ]
@@ -1,58 +1,39 @@
 import pandas as pd
 import numpy as np
 import json
+import pytest
 from src.pipeline.foreign_keys import validate_foreign_keys
 from src.pipeline.run_summary import build_run_summary
 from src.pipeline.policy_enforcement import enforce_pii_policy
+from src.pipeline.data_quality import validate_data_quality
+from src.pipeline.run_pipeline import RAW_DIR, count_events_rows, load_events_raw
 from pathlib import Path as _P
 
 
-def test_validate_foreign_keys_detects_missing_parent_keys():
-    # child table events references user_id 1,2,3 but users table only contains 1
-    df_events = pd.DataFrame({"event_id": [1, 2, 3], "user_id": [1, 2, 3]})
-    df_users = pd.DataFrame({"user_id": [1]})
-
-    dfs = {"events": df_events, "users": df_users}
-    fk_config = [
-        {"table": "events", "column": "user_id", "ref_table": "users", "ref_column": "user_id"}
-    ]
-
-    result = validate_foreign_keys(dfs, fk_config)
-
-    assert result["passed"] is False
-    assert len(result["violations"]) == 1
-    violation = result["violations"][0]
-    assert violation["table"] == "events"
-    assert violation["column"] == "user_id"
-    # missing keys should include 2 and 3
-    assert set(violation["missing_keys"]) == {2, 3}
-
-
-def test_validate_foreign_keys_passes_when_all_parents_exist():
-    df_events = pd.DataFrame({"event_id": [1, 2], "user_id": [1, 2]})
-    df_users = pd.DataFrame({"user_id": [1, 2, 3]})
-
-    dfs = {"events": df_events, "users": df_users}
-    fk_config = [
-        {"table": "events", "column": "user_id", "ref_table": "users", "ref_column": "user_id"}
-    ]
-
-    result = validate_foreign_keys(dfs, fk_config)
-    assert result["passed"] is True
-    assert result["violations"] == []
-
-
-def test_validate_foreign_keys_skips_when_tables_missing():
-    # When ref_table missing, validate_foreign_keys should skip rather than raise
-    df_events = pd.DataFrame({"event_id": [1], "user_id": [1]})
-    dfs = {"events": df_events}
-    fk_config = [
-        {"table": "events", "column": "user_id", "ref_table": "users", "ref_column": "user_id"}
-    ]
-
-    result = validate_foreign_keys(dfs, fk_config)
-    assert result["passed"] is True
-    assert result["violations"] == []
+@pytest.mark.parametrize(
+    "df_users, expected_passed, expected_missing",
+    [
+        # events reference user_id 1,2,3 but users only contains 1
+        (pd.DataFrame({"user_id": [1]}), False, {2, 3}),
+        (pd.DataFrame({"user_id": [1, 2, 3, 4]}), True, set()),
+        # ref_table missing: skipped rather than raising or failing
+        (None, True, set()),
+    ],
+    ids=["missing_parent_keys", "all_parents_exist", "ref_table_missing"],
+)
+def test_validate_foreign_keys(df_events_fk, fk_config_user, df_users, expected_passed, expected_missing):
+    dfs = {"events": df_events_fk}
+    if df_users is not None:
+        dfs["users"] = df_users
+
+    result = validate_foreign_keys(dfs, fk_config_user)
+
+    assert result["passed"] is expected_passed
+    assert len(result["violations"]) == (1 if expected_missing else 0)
+    for violation in result["violations"]:
+        assert violation["table"] == "events"
+        assert violation["column"] == "user_id"
+        assert set(violation["missing_keys"]) == expected_missing
 
 
 def test_build_run_summary_removes_dataframes_and_normalizes_booleans():
@@ -177,6 +158,14 @@ def test_generate_markdown_report_from_component_shape(monkeypatch, tmp_path):
 
     monkeypatch.setattr(CoordinatorAgent, "run", lambda self, config_override=None: component_result)
 
+    # Keep the saved report and summary out of the repo's reports/ and
+    # data/run_summaries, so parallel test runs don't share output dirs.
+    import src.pipeline.report_markdown as rm
+    import src.pipeline.run_summary as rs
+
+    monkeypatch.setattr(rm, "REPORTS_DIR", tmp_path / "reports")
+    monkeypatch.setattr(rs, "RUN_SUMMARIES_DIR", tmp_path / "run_summaries")
+
     # Run the helper which should build a normalized summary, save JSON + markdown
     from src.agents.run_summary_agent import generate_markdown_report
 
@@ -218,3 +207,241 @@ def test_build_run_summary_json_serializable_with_numpy_scalars():
 
     # should be JSON serializable without TypeError
     json.dumps(summary)
+
+
+def test_validate_data_quality_limits_null_fractions_to_threshold_columns():
+    df = pd.DataFrame(
+        {
+            "event_id": ["e1", "e2", None],
+            "user_id": [None, "u2", "u3"],
+            "notes": [None, None, None],
+        }
+    )
+    dq_config = {
+        "max_null_fraction_per_column": 0.5,
+        "null_threshold_columns": ["event_id"],
+        "non_null_columns": ["user_id"],
+    }
+
+    results = validate_data_quality(df, dq_config)
+
+    # nullable 'notes' is outside the threshold list, so it's never reported
+    assert set(results["null_fractions"]) == {"event_id"}
+    assert results["columns_exceeding_null_threshold"] == {}
+    # non-null rules still see their own columns
+    assert results["non_null_violations"] == {"user_id": 1}
+    assert results["passed"] is False
+
+
+def test_validate_data_quality_fail_fast_stops_at_first_failure():
+    df = pd.DataFrame({"event_id": ["e1", "e1"], "user_id": [None, "u2"]})
+    dq_config = {"non_null_columns": ["user_id"], "unique_keys": ["event_id"]}
+
+    full = validate_data_quality(df, dq_config)
+    fast = validate_data_quality(df, dq_config, fail_fast=True)
+
+    assert full["unique_key_violations"] == {"event_id": 1}
+    assert fast["passed"] is False
+    assert fast["non_null_violations"] == {"user_id": 1}
+    # the unique-key check is never reached
+    assert fast["unique_key_violations"] == {}
+
+
+def test_validate_data_quality_counts_missing_event_types_as_invalid():
+    df = pd.DataFrame({"event_type": ["page_view", None, "bogus", None]})
+    dq_config = {"allowed_event_types": ["page_view"]}
+
+    results = validate_data_quality(df, dq_config)
+
+    assert results["invalid_event_types"] == ["bogus"]
+    assert results["null_event_types"] == 2
+    assert results["passed"] is False
+
+    # nulls alone fail the check too
+    only_nulls = validate_data_quality(df[df["event_type"] != "bogus"], dq_config)
+    assert only_nulls["invalid_event_types"] == []
+    assert only_nulls["passed"] is False
+
+
+def test_load_events_raw_matches_pandas_reader():
+    # The Arrow-backed reader must produce the same frame as pd.read_csv:
+    # same NA cells, and ISO timestamps left as strings.
+    for filename in ("test_data/events_rich_sample.csv", "test_data/events_dq_bad_sample.csv"):
+        expected = pd.read_csv(RAW_DIR / filename)
+        pd.testing.assert_frame_equal(load_events_raw(filename), expected)
+
+
+@pytest.mark.parametrize(
+    "csv_text",
+    [
+        "day,at,n\n2024-01-05,12:30:00,1\n2024-01-06,12:30,\n",
+        "a,a\n1,2\n3,4\n",
+        ",b\n1,2\n",
+        "big,small\n99999999999999999999,1\n10000000000000000000,2\n",
+        "flag,word\ntrue,True\nFalse,no\n",
+        "a,b\n1,2\n3\n",
+        "a,empty\n1,\n2,\n",
+    ],
+    ids=[
+        "dates_and_times",
+        "duplicate_header",
+        "empty_header",
+        "int64_overflow",
+        "booleans",
+        "short_row",
+        "all_empty_column",
+    ],
+)
+def test_load_events_raw_matches_pandas_reader_edge_cases(csv_text, tmp_path, monkeypatch):
+    # Cases where pyarrow's inference differs from pandas: either the reader
+    # adjusts its output or the file is handed to pd.read_csv.
+    import src.pipeline.run_pipeline as rp
+
+    monkeypatch.setattr(rp, "RAW_DIR", tmp_path)
+    monkeypatch.setattr(rp, "CSV_CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "events.csv").write_text(csv_text)
+
+    expected = pd.read_csv(tmp_path / "events.csv")
+    pd.testing.assert_frame_equal(load_events_raw("events.csv"), expected)
+    # served from the Parquet cache the second time
+    pd.testing.assert_frame_equal(load_events_raw("events.csv"), expected)
+    assert count_events_rows("events.csv") == len(expected)
+
+
+def test_count_events_rows_matches_loaded_frame():
+    for filename in ("test_data/events_rich_sample.csv", "test_data/events_dq_bad_sample.csv"):
+        assert count_events_rows(filename) == len(load_events_raw(filename))
+
+
+def test_load_events_raw_when_cache_dir_is_unwritable(tmp_path, monkeypatch):
+    # The Parquet cache is best-effort: a cache dir that can't be created
+    # must not stop the raw data from loading.
+    import src.pipeline.run_pipeline as rp
+
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(rp, "CSV_CACHE_DIR", blocker / "cache")
+
+    filename = "test_data/events_rich_sample.csv"
+    expected = pd.read_csv(RAW_DIR / filename)
+    pd.testing.assert_frame_equal(load_events_raw(filename), expected)
+
+
+def test_cached_run_summary_misses_after_schema_change(tmp_path, monkeypatch):
+    import shutil
+
+    import src.agents.run_summary_agent as rsa
+    import src.pipeline.run_pipeline as rp
+    from src.pipeline.run_summary import restamp_summary
+
+    schema_dir = tmp_path / "schema"
+    shutil.copytree(rp.SCHEMA_DIR, schema_dir)
+    monkeypatch.setattr(rp, "SCHEMA_DIR", schema_dir)
+    monkeypatch.setattr(rsa, "_LAST_RUN", None)
+
+    config = {"sources": {"events": {"filename": "test_data/events_sample.csv"}}}
+    summary = {"run_id": "t-cache", "metadata": {"generated_at_utc": "2000-01-01T00:00:00Z"}}
+    rsa.remember_run_summary(config, summary)
+    assert rsa.cached_run_summary(config) is summary
+
+    # A reused summary is dated by the run reusing it
+    restamped = restamp_summary(summary)
+    assert restamped["metadata"]["generated_at_utc"] != "2000-01-01T00:00:00Z"
+    assert summary["metadata"]["generated_at_utc"] == "2000-01-01T00:00:00Z"
+
+    # Editing a schema file the run validates against invalidates the entry
+    events_schema = schema_dir / rp.SCHEMA_FILES["events"]
+    events_schema.write_text(events_schema.read_text() + "\n")
+    assert rsa.cached_run_summary(config) is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib_json"])
+def test_save_run_summary_gzips_large_summaries_with_either_encoder(use_orjson, tmp_path, monkeypatch):
+    import gzip
+
+    import src.pipeline.run_summary as rs
+
+    if use_orjson and rs.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(rs, "orjson", None)
+    monkeypatch.setattr(rs, "RUN_SUMMARIES_DIR", tmp_path)
+
+    small = {"run_id": "t-small"}
+    large = {"run_id": "t-large", "values": ["x" * 100] * (rs.GZIP_THRESHOLD_BYTES // 50)}
+
+    small_path, _ = rs.save_run_summary(small, timestamp="small")
+    large_path, _ = rs.save_run_summary(large, timestamp="large")
+
+    assert small_path.name == "run_summary_small.json"
+    assert json.loads(small_path.read_bytes()) == small
+    assert large_path.name == "run_summary_large.json.gz"
+    assert json.loads(gzip.decompress(large_path.read_bytes())) == large
+
+
+# The orjson / pyarrow speedups (requirements-fast.txt) are optional; each
+# module must behave the same on its fallback branch.
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib_json"])
+def test_auto_runner_state_round_trips_with_either_codec(use_orjson, tmp_path, monkeypatch):
+    import src.pipeline.auto_runner as ar
+
+    if use_orjson and ar.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(ar, "orjson", None)
+    monkeypatch.setattr(ar, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(ar, "STATE_PATH", tmp_path / "auto_runner_state.json")
+
+    state = ar.AutoRunState(last_processed_mtime_ns=123, last_summary_hash="abc")
+    state.save()
+
+    assert ar.AutoRunState.load() == state
+    # same 2-space indented layout from either codec
+    assert ar.STATE_PATH.read_text().startswith('{\n  "last_processed_mtime_ns": 123')
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False], ids=["pyarrow", "pandas"])
+def test_curated_csv_and_raw_reader_with_or_without_pyarrow(use_pyarrow, tmp_path, monkeypatch):
+    import src.pipeline.run_pipeline as rp
+
+    if use_pyarrow and rp.pa_csv is None:
+        pytest.skip("pyarrow not installed")
+    if not use_pyarrow:
+        monkeypatch.setattr(rp, "pa_csv", None)
+
+    filename = "test_data/events_rich_sample.csv"
+    expected = pd.read_csv(RAW_DIR / filename)
+    df = load_events_raw(filename)
+    pd.testing.assert_frame_equal(df, expected)
+
+    rp.save_events_curated(df, "curated.csv", out_dir=tmp_path)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "curated.csv"), expected)
+
+
+def test_save_events_curated_rejects_unknown_format_and_writes_mixed_columns(tmp_path):
+    from src.pipeline.run_pipeline import save_events_curated
+
+    df = pd.DataFrame({"event_id": ["e1", "e2"], "mixed": [1, "a"]})
+
+    with pytest.raises(ValueError):
+        save_events_curated(df, "out.csv", "parqet", out_dir=tmp_path)
+    assert not (tmp_path / "out.csv").exists()
+
+    # Arrow can't convert the mixed-type column; pandas' writer takes over
+    save_events_curated(df, "out.csv", out_dir=tmp_path)
+    assert pd.read_csv(tmp_path / "out.csv")["mixed"].tolist() == ["1", "a"]
+
+
+def test_csv_cache_keeps_other_sources_copies(tmp_path, monkeypatch):
+    # events.csv's stale-copy cleanup must not delete events.csv.2024.csv's cache
+    import src.pipeline.run_pipeline as rp
+
+    monkeypatch.setattr(rp, "RAW_DIR", tmp_path)
+    monkeypatch.setattr(rp, "CSV_CACHE_DIR", tmp_path / "cache")
+    for name in ("events.csv.2024.csv", "events.csv"):
+        (tmp_path / name).write_text("a,b\n1,2\n")
+        load_events_raw(name)
+
+    cached = [p.name for p in (tmp_path / "cache").iterdir()]
+    assert len(cached) == 2
+    assert any(name.startswith("events.csv.2024.csv.") for name in cached)
@@ -1,48 +1,63 @@
+import copy
 from pathlib import Path
 
+import pytest
+
 from src.pipeline.report_markdown import (
     build_markdown_from_summary,
+    iter_markdown_sections,
+    markdown_preview,
     save_markdown_report,
 )
 
 
-def _minimal_fake_summary():
-    return {
-        "run_id": "test-run-123",
-        "description": "Test summary for report generation.",
-        "overall_passed": True,
-        "lineage": {
-            "source": {"filename": "events_sample.csv", "rows_in": 4},
-            "target": {"filename": "analytics_events.csv", "rows_out": 4},
+# Shared by the tests that only read it; tests that modify a summary take a
+# copy from _minimal_fake_summary().
+_MINIMAL_FAKE_SUMMARY = {
+    "run_id": "test-run-123",
+    "description": "Test summary for report generation.",
+    "overall_passed": True,
+    "lineage": {
+        "source": {"filename": "events_sample.csv", "rows_in": 4},
+        "target": {"filename": "analytics_events.csv", "rows_out": 4},
+    },
+    "checks": {
+        "schema": {
+            "passed": True,
+            "missing_columns": [],
+            "extra_columns": [],
+            "invalid_values": {},
         },
-        "checks": {
-            "schema": {
-                "passed": True,
-                "missing_columns": [],
-                "extra_columns": [],
-                "invalid_values": {},
-            },
-            "data_quality": {
-                "passed": True,
-                "null_fractions": {},
-                "columns_exceeding_null_threshold": {},
-                "non_null_violations": [],
-                "unique_key_violations": [],
-                "invalid_event_types": [],
-            },
-            "pii_policy": {
-                "passed": True,
-                "detected_pii_columns": ["user_email", "ip_address"],
-                "removed_pii_columns": ["user_email", "ip_address"],
-                "remaining_pii_in_curated": [],
-            },
+        "data_quality": {
+            "passed": True,
+            "null_fractions": {},
+            "columns_exceeding_null_threshold": {},
+            "non_null_violations": [],
+            "unique_key_violations": [],
+            "invalid_event_types": [],
         },
-    }
+        "pii_policy": {
+            "passed": True,
+            "detected_pii_columns": ["user_email", "ip_address"],
+            "removed_pii_columns": ["user_email", "ip_address"],
+            "remaining_pii_in_curated": [],
+        },
+    },
+}
 
 
-def test_build_markdown_from_summary_returns_non_empty_markdown():
-    summary = _minimal_fake_summary()
-    md = build_markdown_from_summary(summary)
+def _minimal_fake_summary():
+    return copy.deepcopy(_MINIMAL_FAKE_SUMMARY)
+
+
+@pytest.fixture(scope="session")
+def minimal_markdown():
+    """Markdown for _MINIMAL_FAKE_SUMMARY, rendered once for every test that reads it."""
+    return build_markdown_from_summary(_MINIMAL_FAKE_SUMMARY)
+
+
+def test_build_markdown_from_summary_returns_non_empty_markdown(minimal_markdown):
+    md = minimal_markdown
 
     assert isinstance(md, str)
     assert "# Data Pipeline Governance Report" in md
@@ -51,18 +66,48 @@ def test_build_markdown_from_summary_returns_non_empty_markdown():
     assert len(md) > 50  # some minimal length
 
 
-def test_save_markdown_report_creates_file(tmp_path, monkeypatch):
-    """Ensure save_markdown_report writes a file under a reports/ directory."""
-    summary = _minimal_fake_summary()
-    md = build_markdown_from_summary(summary)
-
-    # Run the function with cwd set to a temporary directory,
-    # so Path("reports") will resolve under tmp_path.
-    monkeypatch.chdir(tmp_path)
+def test_save_markdown_report_creates_file(tmp_path, minimal_markdown):
+    """Ensure save_markdown_report writes a file under the given reports/ directory."""
+    md = minimal_markdown
 
-    path = save_markdown_report(md, timestamp="test_report")
+    path = save_markdown_report(md, timestamp="test_report", out_dir=tmp_path / "reports")
 
     report_file = Path(path)
+    assert report_file.parent == tmp_path / "reports"
     assert report_file.exists()
-    content = report_file.read_text(encoding="utf-8")
+    content = report_file.read_bytes().decode("utf-8")
     assert "Data Pipeline Governance Report" in content
+
+
+def test_markdown_preview_matches_splitlines_head(minimal_markdown):
+    md = minimal_markdown
+
+    for text in (md, md + "\n", "", "one line", "a\n\n"):
+        for n in (0, 1, 5, 40):
+            assert markdown_preview(text, n) == "\n".join(text.splitlines()[:n])
+
+
+def test_save_markdown_report_streams_sections(minimal_markdown, tmp_path):
+    path = save_markdown_report(
+        iter_markdown_sections(_MINIMAL_FAKE_SUMMARY),
+        timestamp="test_stream",
+        out_dir=tmp_path,
+    )
+
+    assert Path(path).read_text(encoding="utf-8") == minimal_markdown
+
+
+def test_build_markdown_lists_dq_violation_examples():
+    summary = _minimal_fake_summary()
+    summary["checks"]["data_quality"].update(
+        passed=False,
+        non_null_violations={"user_id": 3},
+        invalid_event_types=["a", "b", "c", "d", "e"],
+        invalid_event_types_total=12,
+    )
+
+    md = build_markdown_from_summary(summary)
+
+    # DQ results store violations as column -> count mappings
+    assert "  - `user_id`: 3\n" in md
+    assert "(showing 5 of 12)" in md